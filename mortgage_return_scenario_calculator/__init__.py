@@ -5,8 +5,9 @@ from mortgage_return_scenario_calculator.models import (
     ScenarioInputs,
     InvestmentRestrictions,
     ScenarioResult,
+    ScenarioResultBatch,
 )
-from mortgage_return_scenario_calculator.calculator import ScenarioCalculator
+from mortgage_return_scenario_calculator.calculator import ScenarioCalculator, Violation
 from mortgage_return_scenario_calculator.config_generator import ConfigGenerator
 from mortgage_return_scenario_calculator.exporter import (
     ScenarioExporter,
@@ -18,7 +19,9 @@ __all__ = [
     "ScenarioInputs",
     "InvestmentRestrictions",
     "ScenarioResult",
+    "ScenarioResultBatch",
     "ScenarioCalculator",
+    "Violation",
     "ConfigGenerator",
     "ScenarioExporter",
     "export_scenario_to_csv",
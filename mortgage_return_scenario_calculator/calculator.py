@@ -4,7 +4,10 @@ This module contains the ScenarioCalculator class that orchestrates
 all investment calculations.
 """
 
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, fields
+from enum import IntFlag
+from math import expm1, log1p
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from mortgage_return_scenario_calculator.models import (
     InvestmentAssumptions,
@@ -17,22 +20,239 @@ from mortgage_return_scenario_calculator.models import (
     PortfolioMetrics,
     TaxMetrics,
     ScenarioResult,
-)
-from mortgage_return_scenario_calculator.financial import (
-    calculate_pmt,
-    calculate_fv,
-    calculate_pv,
-    calculate_compound_growth,
-    calculate_compound_value,
-    calculate_annualized_return,
+    ScenarioResultBatch,
 )
 from mortgage_return_scenario_calculator.tax_config import (
+    CAPITAL_GAINS_TAX_RATE,
     calculate_purchase_tax,
-    calculate_purchase_tax_rate,
-    calculate_capital_gains_tax,
+    calculate_purchase_tax_batch,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _loan_core(
+    loan_amount: float,
+    annual_rate: float,
+    num_payments: int,
+    growth: Optional[float] = None,
+) -> Tuple[float, float, float]:
+    """Closed-form annuity for a fully amortizing loan.
+    
+    Pure float arithmetic equivalent to ``calculate_pmt``, without the
+    numpy-financial call overhead on the scalar path.
+    
+    Args:
+        loan_amount: Loan principal (positive).
+        annual_rate: Annual interest rate as decimal.
+        num_payments: Number of monthly payments.
+        growth: Precomputed ``(1 + monthly_rate) ** num_payments`` (computed
+            if omitted).
+    
+    Returns:
+        Tuple of (monthly_payment, total_payments, total_interest).
+    """
+    monthly_rate = annual_rate / 12
+    if monthly_rate == 0:
+        monthly_payment = loan_amount / num_payments
+    else:
+        if growth is None:
+            growth = (1 + monthly_rate) ** num_payments
+        monthly_payment = loan_amount * monthly_rate * growth / (growth - 1)
+    total_payments = monthly_payment * num_payments
+    return monthly_payment, total_payments, total_payments - loan_amount
+
+
+def _annuity_pv(
+    monthly_rate: float,
+    num_payments: int,
+    payment: float,
+    discount: Optional[float] = None,
+) -> float:
+    """Closed-form present value of an annuity (same sign convention as ``calculate_pv``).
+    
+    Args:
+        monthly_rate: Interest rate per period as decimal.
+        num_payments: Number of remaining payments.
+        payment: Payment made each period.
+        discount: Precomputed ``(1 + monthly_rate) ** -num_payments``
+            (computed if omitted).
+    
+    Returns:
+        Present value (negative for a positive payment).
+    """
+    if monthly_rate == 0:
+        return -payment * num_payments
+    if discount is None:
+        discount = (1 + monthly_rate) ** -num_payments
+    return -payment * (1 - discount) / monthly_rate
+
+
+def _annuity_pv_array(
+    monthly_rate: "np.ndarray",
+    num_payments: "np.ndarray",
+    payment: "np.ndarray",
+    discount: "np.ndarray",
+) -> "np.ndarray":
+    """Vectorized ``_annuity_pv``; call inside ``np.errstate(divide="ignore", invalid="ignore")``.
+    
+    Args:
+        monthly_rate: Interest rates per period.
+        num_payments: Numbers of remaining payments.
+        payment: Payments made each period.
+        discount: ``(1 + monthly_rate) ** -num_payments``.
+    
+    Returns:
+        Present value for each element.
+    """
+    import numpy as np
+    
+    return np.where(
+        monthly_rate == 0,
+        -payment * num_payments,
+        -payment * (1 - discount) / monthly_rate,
+    )
+
+
+def _growth(rate: float, periods: float) -> float:
+    """Compound growth ``(1 + rate) ** periods - 1``.
+    
+    Evaluated as ``expm1(periods * log1p(rate))``, which keeps full precision
+    for small rates. ``log1p`` is undefined for ``rate <= -1`` (a total loss
+    or worse), so that domain falls back to the direct power. A negative base
+    with a fractional exponent has no real value and gives NaN, as NumPy does
+    in ``_growth_array``.
+    
+    Args:
+        rate: Growth rate per period as decimal.
+        periods: Number of compounding periods.
+    
+    Returns:
+        Growth over all periods, as a fraction of the starting value.
+    """
+    if rate > -1:
+        return expm1(periods * log1p(rate))
+    if rate < -1 and not float(periods).is_integer():
+        return float("nan")
+    return (1 + rate) ** periods - 1
+
+
+def _growth_array(rate: "np.ndarray", periods: "np.ndarray") -> "np.ndarray":
+    """Vectorized ``_growth``; call inside ``np.errstate(invalid="ignore")``.
+    
+    Args:
+        rate: Growth rates per period.
+        periods: Numbers of compounding periods.
+    
+    Returns:
+        Growth over all periods for each element.
+    """
+    import numpy as np
+    
+    return np.where(
+        rate > -1, np.expm1(periods * np.log1p(rate)), (1 + rate) ** periods - 1
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _DerivedConstants:
+    """Per-calculator constants derived once from inputs and assumptions.
+    
+    Attributes:
+        rental_yield: Annual rent as a fraction of property price.
+        num_payments: Number of monthly mortgage payments.
+        months_until_sale: Number of months until the property is sold.
+        appreciation_growth: Property growth until sale, ``(1 + rate) ** years - 1``.
+        portfolio_factor: Annual-compounding portfolio growth factor until sale.
+        deposit_growth: Monthly-compounding portfolio growth until sale,
+            ``(1 + rate / 12) ** months - 1``.
+        mortgage_growth: ``(1 + monthly mortgage rate) ** num_payments``.
+        mortgage_growth_at_sale: ``(1 + monthly mortgage rate) ** months_until_sale``.
+    """
+    rental_yield: float
+    num_payments: int
+    months_until_sale: int
+    appreciation_growth: float
+    portfolio_factor: float
+    deposit_growth: float
+    mortgage_growth: float
+    mortgage_growth_at_sale: float
+
+
+def _derive_constants(
+    inputs: ScenarioInputs,
+    assumptions: InvestmentAssumptions,
+    monthly_rent: float,
+) -> _DerivedConstants:
+    """Compute the constants shared by the per-stage calculations.
+    
+    Args:
+        inputs: Property-specific scenario inputs.
+        assumptions: Market assumptions.
+        monthly_rent: Monthly rent derived from the rental yield.
+    
+    Growth terms of the form ``(1 + r) ** n - 1`` go through ``_growth``.
+    
+    Returns:
+        _DerivedConstants for the scenario.
+    """
+    years = inputs.years_until_sale
+    months_until_sale = years * 12
+    num_payments = inputs.mortgage_term_years * 12
+    mortgage_base = 1 + assumptions.mortgage_rate / 12
+    return _DerivedConstants(
+        rental_yield=(monthly_rent * 12) / inputs.property_price,
+        num_payments=num_payments,
+        months_until_sale=months_until_sale,
+        appreciation_growth=_growth(assumptions.appreciation_rate, years),
+        portfolio_factor=(1 + assumptions.portfolio_return_rate) ** years,
+        deposit_growth=_growth(assumptions.portfolio_return_rate / 12, months_until_sale),
+        mortgage_growth=mortgage_base ** num_payments,
+        mortgage_growth_at_sale=mortgage_base ** months_until_sale,
+    )
+
+
+# Shared defaults (frozen, so safe to reuse across calculators)
+_DEFAULT_ASSUMPTIONS = InvestmentAssumptions()
+_DEFAULT_RESTRICTIONS = InvestmentRestrictions()
+
+# Assumptions consumed by the calculation (and so usable in a sensitivity sweep)
+_SWEEPABLE_ASSUMPTIONS = (
+    "rental_yield",
+    "mortgage_rate",
+    "early_repayment_rate",
+    "appreciation_rate",
+    "portfolio_return_rate",
+    "capital_gains_tax_rate",
 )
 
 
+
+class Violation(IntFlag):
+    """Restriction violations reported by ScenarioCalculator.check_restrictions.
+    
+    Membership tests (``Violation.LOAN_TO_VALUE in violations``) are a
+    single bit test, so callers never need to scan error messages.
+    """
+    
+    DOWN_PAYMENT = 1 << 0
+    LOAN_TO_VALUE = 1 << 1
+    MORTGAGE_PERCENTAGE = 1 << 2
+    MORTGAGE_TO_INCOME = 1 << 3
+    NEGATIVE_CASH_FLOW = 1 << 4
+    URBAN_RENEWAL = 1 << 5
+
+
+# Plain-int flag values, so building the mask avoids enum arithmetic
+_DOWN_PAYMENT_VIOLATION = Violation.DOWN_PAYMENT.value
+_LOAN_TO_VALUE_VIOLATION = Violation.LOAN_TO_VALUE.value
+_MORTGAGE_PCT_VIOLATION = Violation.MORTGAGE_PERCENTAGE.value
+_MORTGAGE_TO_INCOME_VIOLATION = Violation.MORTGAGE_TO_INCOME.value
+_CASH_FLOW_VIOLATION = Violation.NEGATIVE_CASH_FLOW.value
+_URBAN_RENEWAL_VIOLATION = Violation.URBAN_RENEWAL.value
+
+
 class ScenarioCalculator:
     """Main calculator for investment scenario analysis.
     
@@ -78,15 +298,31 @@ class ScenarioCalculator:
             restrictions: Investment restrictions (uses defaults if not provided).
         """
         self.inputs = inputs
-        self.assumptions = assumptions or InvestmentAssumptions()
-        self.restrictions = restrictions or InvestmentRestrictions()
+        self.assumptions = assumptions if assumptions is not None else _DEFAULT_ASSUMPTIONS
+        self.restrictions = restrictions if restrictions is not None else _DEFAULT_RESTRICTIONS
         
         # Calculate derived values
         self.monthly_rent = inputs.calculate_monthly_rent(self.assumptions.rental_yield)
+        self._derived = _derive_constants(inputs, self.assumptions, self.monthly_rent)
+        
+        # Memoized loan metrics (inputs and assumptions are frozen)
+        self._loan_metrics: Optional[LoanMetrics] = None
     
     def calculate_loan_metrics(self) -> LoanMetrics:
         """Calculate all loan-related metrics.
         
+        The result is computed on first use and reused afterwards.
+        
+        Returns:
+            LoanMetrics with all calculated values.
+        """
+        if self._loan_metrics is None:
+            self._loan_metrics = self._compute_loan_metrics()
+        return self._loan_metrics
+    
+    def _compute_loan_metrics(self) -> LoanMetrics:
+        """Calculate loan metrics without consulting the memoized value.
+        
         Returns:
             LoanMetrics with all calculated values.
         """
@@ -111,15 +347,13 @@ class ScenarioCalculator:
         leverage_multiplier = 1 / equity_ratio if equity_ratio > 0 else float('inf')
         
         # Calculate mortgage payment
-        num_payments = self.inputs.mortgage_term_years * 12
-        monthly_payment = calculate_pmt(
+        num_payments = self._derived.num_payments
+        monthly_payment, total_payments, total_interest = _loan_core(
+            loan_amount,
             self.assumptions.mortgage_rate,
             num_payments,
-            loan_amount
+            self._derived.mortgage_growth,
         )
-        
-        total_payments = monthly_payment * num_payments
-        total_interest = total_payments - loan_amount
         avg_monthly_interest = total_interest / num_payments if num_payments > 0 else 0
         
         # Calculate mortgage-to-income ratio using actual income
@@ -149,23 +383,30 @@ class ScenarioCalculator:
         Returns:
             CashFlowMetrics with all calculated values.
         """
-        rental_yield = (self.monthly_rent * 12) / self.inputs.property_price
+        rental_yield = self._derived.rental_yield
+        
+        # Full cash purchase: all rent is net cash flow and there is no leverage
+        if loan_metrics.loan_amount <= 0:
+            return CashFlowMetrics(
+                monthly_rent=self.monthly_rent,
+                rental_yield=rental_yield,
+                monthly_net_cash_flow=self.monthly_rent,
+                monthly_interest_flow=self.monthly_rent,
+                avg_principal_payment=0,
+                leveraged_rental_yield=rental_yield,
+                net_leveraged_yield=rental_yield,
+            )
+        
         monthly_net_cash_flow = self.monthly_rent - loan_metrics.monthly_payment
         monthly_interest_flow = self.monthly_rent - loan_metrics.avg_monthly_interest
         
         # Average principal payment (negative because it reduces debt)
-        if loan_metrics.loan_amount > 0 and self.inputs.mortgage_term_years > 0:
-            avg_principal_payment = -loan_metrics.loan_amount / (12 * self.inputs.mortgage_term_years)
-        else:
-            avg_principal_payment = 0
+        avg_principal_payment = -loan_metrics.loan_amount / self._derived.num_payments
         
         leveraged_rental_yield = rental_yield * loan_metrics.leverage_multiplier
         
-        # Net leveraged yield (subtract interest rate if there's a loan)
-        if loan_metrics.loan_amount > 0:
-            net_leveraged_yield = leveraged_rental_yield - self.assumptions.mortgage_rate
-        else:
-            net_leveraged_yield = leveraged_rental_yield
+        # Net leveraged yield (subtract interest rate on the loan)
+        net_leveraged_yield = leveraged_rental_yield - self.assumptions.mortgage_rate
         
         return CashFlowMetrics(
             monthly_rent=self.monthly_rent,
@@ -190,17 +431,11 @@ class ScenarioCalculator:
         years = self.inputs.years_until_sale
         
         # Property appreciation
-        property_appreciation = calculate_compound_growth(
-            self.inputs.property_price,
-            self.assumptions.appreciation_rate,
-            years
-        )
+        property_appreciation = self.inputs.property_price * self._derived.appreciation_growth
         
         # Urban renewal appreciation
-        urban_renewal_appreciation = calculate_compound_growth(
-            self.inputs.urban_renewal_value,
-            self.assumptions.appreciation_rate,
-            years
+        urban_renewal_appreciation = (
+            self.inputs.urban_renewal_value * self._derived.appreciation_growth
         )
         
         # Total appreciation includes urban renewal value plus both appreciations
@@ -215,8 +450,12 @@ class ScenarioCalculator:
         # Total return rate
         total_return_rate = (sale_value / self.inputs.property_price) - 1
         
-        # Annualized return
-        annualized_return = calculate_annualized_return(total_return_rate, years)
+        # Annualized return: closed form of npf.rate with no payments, reusing
+        # the growth ratio instead of running the iterative solver
+        if years > 0 and total_return_rate != 0:
+            annualized_return = _growth(total_return_rate, 1 / years)
+        else:
+            annualized_return = 0.0
         
         # Leveraged return
         leveraged_return = annualized_return * loan_metrics.leverage_multiplier
@@ -269,18 +508,22 @@ class ScenarioCalculator:
             )
         
         # Remaining mortgage (simplified linear calculation)
+        # Matches the spreadsheet model (row 38): the unpaid share of total
+        # payments, not the amortized principal balance. Already O(1).
         remaining_ratio = (mortgage_term - years_until_sale) / mortgage_term
         remaining_mortgage = remaining_ratio * loan_metrics.total_payments
         
         # Early repayment penalty calculation
         # PV at current rate minus PV at early repayment rate
-        remaining_months = (mortgage_term - years_until_sale) * 12
-        pv_current = calculate_pv(
+        remaining_months = self._derived.num_payments - self._derived.months_until_sale
+        # (1+r)**-(n-k) from the cached powers, instead of another pow
+        pv_current = _annuity_pv(
             self.assumptions.mortgage_rate / 12,
             remaining_months,
-            loan_metrics.monthly_payment
+            loan_metrics.monthly_payment,
+            self._derived.mortgage_growth_at_sale / self._derived.mortgage_growth,
         )
-        pv_new = calculate_pv(
+        pv_new = _annuity_pv(
             self.assumptions.early_repayment_rate / 12,
             remaining_months,
             loan_metrics.monthly_payment
@@ -321,10 +564,9 @@ class ScenarioCalculator:
             property_value=self.inputs.property_price,
             is_first_house=self.inputs.is_first_house
         )
-        purchase_tax_rate = calculate_purchase_tax_rate(
-            property_value=self.inputs.property_price,
-            is_first_house=self.inputs.is_first_house
-        )
+        # Effective rate from the tax already computed (same as
+        # calculate_purchase_tax_rate, without walking the brackets twice)
+        purchase_tax_rate = purchase_tax / self.inputs.property_price
         
         # Capital gains tax - paid at the end (when selling)
         sale_value = appreciation_metrics.sale_value
@@ -335,12 +577,9 @@ class ScenarioCalculator:
             self.inputs.improvement_costs
         )
         
-        capital_gains_tax = calculate_capital_gains_tax(
-            sale_price=sale_value,
-            purchase_price=self.inputs.property_price,
-            purchase_tax_paid=purchase_tax,
-            improvement_costs=self.inputs.improvement_costs
-        )
+        # Same rule as calculate_capital_gains_tax, applied to the gain
+        # already computed above instead of re-deriving it
+        capital_gains_tax = capital_gains * CAPITAL_GAINS_TAX_RATE if capital_gains > 0 else 0.0
         
         # Total taxes
         total_taxes = purchase_tax + capital_gains_tax
@@ -368,38 +607,38 @@ class ScenarioCalculator:
         Returns:
             PortfolioMetrics with all calculated values.
         """
-        years = self.inputs.years_until_sale
-        months = years * 12
+        months = self._derived.months_until_sale
         monthly_rate = self.assumptions.portfolio_return_rate / 12
         
         # Cash invested in portfolio (what wasn't used for down payment)
         cash_in_portfolio = self.inputs.available_cash - self.inputs.down_payment
         
         # Growth of initial investment
-        portfolio_initial_growth = calculate_compound_value(
-            cash_in_portfolio,
-            self.assumptions.portfolio_return_rate,
-            years
-        )
+        portfolio_initial_growth = cash_in_portfolio * self._derived.portfolio_factor
         
         # Monthly deposits (available + cash flow from property)
         monthly_deposits = self.inputs.monthly_available + cash_flow_metrics.monthly_net_cash_flow
+        total_deposited = monthly_deposits * months
         
-        # Value accumulated from monthly deposits
-        accumulated_deposits = calculate_fv(monthly_rate, months, -monthly_deposits)
+        # Value accumulated from monthly deposits (closed-form future value of
+        # an annuity; no month-by-month accumulation)
+        if monthly_rate == 0:
+            accumulated_deposits = total_deposited
+        else:
+            accumulated_deposits = monthly_deposits * self._derived.deposit_growth / monthly_rate
         
         # Total portfolio value
         total_portfolio_value = portfolio_initial_growth + accumulated_deposits
         
         # After capital gains tax (25% on gains)
-        deposit_gains = accumulated_deposits - (monthly_deposits * months)
+        deposit_gains = accumulated_deposits - total_deposited
         initial_gains = portfolio_initial_growth - cash_in_portfolio
         total_gains = deposit_gains + initial_gains
         tax = total_gains * self.assumptions.capital_gains_tax_rate if total_gains > 0 else 0
         portfolio_after_tax = total_portfolio_value - tax
         
         # Net profit
-        total_contributions = cash_in_portfolio + (monthly_deposits * months)
+        total_contributions = cash_in_portfolio + total_deposited
         net_portfolio_profit = portfolio_after_tax - total_contributions
         
         return PortfolioMetrics(
@@ -412,64 +651,135 @@ class ScenarioCalculator:
             net_portfolio_profit=net_portfolio_profit,
         )
     
-    def validate(self) -> Tuple[bool, List[str]]:
+    def check_restrictions(
+        self,
+        loan_metrics: Optional[LoanMetrics] = None,
+        cash_flow_metrics: Optional[CashFlowMetrics] = None,
+    ) -> Violation:
+        """Check inputs against restrictions without formatting messages.
+        
+        Args:
+            loan_metrics: Precomputed loan metrics (calculated if omitted).
+            cash_flow_metrics: Precomputed cash flow metrics (calculated if omitted).
+        
+        Returns:
+            Violation flags; empty (falsy) when every restriction is met.
+        """
+        if loan_metrics is None:
+            loan_metrics = self.calculate_loan_metrics()
+        if cash_flow_metrics is None:
+            cash_flow_metrics = self.calculate_cash_flow(loan_metrics)
+        
+        restrictions = self.restrictions
+        property_price = self.inputs.property_price
+        
+        # int() because NumPy scalar inputs make the mask a numpy integer,
+        # which the enum constructor rejects
+        return Violation(int(
+            _DOWN_PAYMENT_VIOLATION * (
+                self.inputs.down_payment / property_price < restrictions.min_down_payment_percentage
+            ) |
+            _LOAN_TO_VALUE_VIOLATION * (loan_metrics.leverage_ratio > restrictions.max_loan_to_value) |
+            _MORTGAGE_PCT_VIOLATION * (
+                loan_metrics.loan_amount / property_price > restrictions.max_mortgage_percentage
+            ) |
+            _MORTGAGE_TO_INCOME_VIOLATION * (
+                loan_metrics.mortgage_to_income_ratio > restrictions.max_mortgage_to_income_ratio
+            ) |
+            _CASH_FLOW_VIOLATION * (
+                restrictions.require_positive_cash_flow and
+                cash_flow_metrics.monthly_net_cash_flow < 0
+            ) |
+            _URBAN_RENEWAL_VIOLATION * (
+                self.inputs.urban_renewal_value > restrictions.max_urban_renewal_value
+            )
+        ))
+    
+    def validate(
+        self,
+        loan_metrics: Optional[LoanMetrics] = None,
+        cash_flow_metrics: Optional[CashFlowMetrics] = None,
+    ) -> Tuple[bool, List[str]]:
         """Validate inputs against restrictions.
         
+        Error messages are only formatted when at least one restriction
+        is violated; use check_restrictions() to get the flags alone.
+        
+        Args:
+            loan_metrics: Precomputed loan metrics (calculated if omitted).
+            cash_flow_metrics: Precomputed cash flow metrics (calculated if omitted).
+        
         Returns:
             Tuple of (is_valid, list of error messages).
         """
-        errors = []
+        if loan_metrics is None:
+            loan_metrics = self.calculate_loan_metrics()
+        if cash_flow_metrics is None:
+            cash_flow_metrics = self.calculate_cash_flow(loan_metrics)
+        
+        violations = self.check_restrictions(loan_metrics, cash_flow_metrics)
+        if not violations:
+            return True, []
+        return False, self._validation_errors(violations, loan_metrics, cash_flow_metrics)
+    
+    def _validation_errors(
+        self,
+        violations: Violation,
+        loan_metrics: LoanMetrics,
+        cash_flow_metrics: CashFlowMetrics,
+    ) -> List[str]:
+        """Format error messages for the violated restrictions.
         
-        # Calculate necessary metrics for validation
-        loan_metrics = self.calculate_loan_metrics()
-        cash_flow_metrics = self.calculate_cash_flow(loan_metrics)
+        Args:
+            violations: Violated restrictions.
+            loan_metrics: Loan metrics used for validation.
+            cash_flow_metrics: Cash flow metrics used for validation.
         
-        # Check down payment percentage
-        down_payment_pct = self.inputs.down_payment / self.inputs.property_price
-        if down_payment_pct < self.restrictions.min_down_payment_percentage:
+        Returns:
+            List of error messages, in restriction order.
+        """
+        restrictions = self.restrictions
+        errors = []
+        
+        if Violation.DOWN_PAYMENT in violations:
+            down_payment_pct = self.inputs.down_payment / self.inputs.property_price
             errors.append(
                 f"Down payment {down_payment_pct:.1%} is below minimum "
-                f"{self.restrictions.min_down_payment_percentage:.1%}"
+                f"{restrictions.min_down_payment_percentage:.1%}"
             )
         
-        # Check loan-to-value ratio
-        if loan_metrics.leverage_ratio > self.restrictions.max_loan_to_value:
+        if Violation.LOAN_TO_VALUE in violations:
             errors.append(
                 f"Loan-to-value {loan_metrics.leverage_ratio:.1%} exceeds maximum "
-                f"{self.restrictions.max_loan_to_value:.1%}"
+                f"{restrictions.max_loan_to_value:.1%}"
             )
         
-        # Check mortgage percentage of property value
-        mortgage_pct = loan_metrics.loan_amount / self.inputs.property_price
-        if mortgage_pct > self.restrictions.max_mortgage_percentage:
+        if Violation.MORTGAGE_PERCENTAGE in violations:
+            mortgage_pct = loan_metrics.loan_amount / self.inputs.property_price
             errors.append(
                 f"Mortgage {mortgage_pct:.1%} of property value exceeds maximum "
-                f"{self.restrictions.max_mortgage_percentage:.1%}"
+                f"{restrictions.max_mortgage_percentage:.1%}"
             )
         
-        # Check mortgage-to-income ratio
-        if loan_metrics.mortgage_to_income_ratio > self.restrictions.max_mortgage_to_income_ratio:
+        if Violation.MORTGAGE_TO_INCOME in violations:
             errors.append(
                 f"Mortgage payment {loan_metrics.mortgage_to_income_ratio:.1%} of income "
-                f"exceeds maximum {self.restrictions.max_mortgage_to_income_ratio:.1%} "
+                f"exceeds maximum {restrictions.max_mortgage_to_income_ratio:.1%} "
                 f"(payment: {loan_metrics.monthly_payment:,.0f}, income: {self.inputs.monthly_income:,.0f})"
             )
         
-        # Check positive cash flow requirement
-        if self.restrictions.require_positive_cash_flow:
-            if cash_flow_metrics.monthly_net_cash_flow < 0:
-                errors.append(
-                    f"Negative cash flow: {cash_flow_metrics.monthly_net_cash_flow:,.0f}/month"
-                )
+        if Violation.NEGATIVE_CASH_FLOW in violations:
+            errors.append(
+                f"Negative cash flow: {cash_flow_metrics.monthly_net_cash_flow:,.0f}/month"
+            )
         
-        # Check urban renewal cap
-        if self.inputs.urban_renewal_value > self.restrictions.max_urban_renewal_value:
+        if Violation.URBAN_RENEWAL in violations:
             errors.append(
                 f"Urban renewal value {self.inputs.urban_renewal_value:,.0f} exceeds maximum "
-                f"{self.restrictions.max_urban_renewal_value:,.0f}"
+                f"{restrictions.max_urban_renewal_value:,.0f}"
             )
         
-        return len(errors) == 0, errors
+        return errors
     
     def calculate(self) -> ScenarioResult:
         """Run all calculations and return complete result.
@@ -488,7 +798,7 @@ class ScenarioCalculator:
         tax_metrics = self.calculate_taxes(appreciation_metrics, early_repayment_metrics)
         
         # Validate
-        is_valid, validation_errors = self.validate()
+        is_valid, validation_errors = self.validate(loan_metrics, cash_flow_metrics)
         
         # Calculate final summary values
         # Total value = property proceeds (after capital gains tax) + portfolio value (after tax)
@@ -514,7 +824,13 @@ class ScenarioCalculator:
         # Annual return
         years = self.inputs.years_until_sale
         if self.inputs.available_cash > 0 and years > 0:
-            annual_return = (total_value_at_sale / self.inputs.available_cash) ** (1 / years) - 1
+            value_multiple = total_value_at_sale / self.inputs.available_cash
+            # A negative value at sale has no real annualized return (NaN, as in
+            # the batch path); a float power would silently return a complex.
+            if value_multiple < 0:
+                annual_return = float("nan")
+            else:
+                annual_return = value_multiple ** (1 / years) - 1
         else:
             annual_return = 0
         
@@ -534,3 +850,413 @@ class ScenarioCalculator:
             validation_errors=validation_errors,
         )
 
+    
+    @classmethod
+    def calculate_batch(
+        cls,
+        property_price,
+        down_payment,
+        available_cash,
+        monthly_income,
+        monthly_available,
+        mortgage_term_years,
+        years_until_sale,
+        urban_renewal_value=0.0,
+        is_first_house=True,
+        improvement_costs=0.0,
+        assumptions: Optional[InvestmentAssumptions] = None,
+        restrictions: Optional[InvestmentRestrictions] = None,
+    ) -> ScenarioResultBatch:
+        """Calculate many scenarios at once using vectorized numpy arithmetic.
+        
+        Each input accepts a scalar or an array; all inputs are broadcast
+        to a common 1-D shape and every scenario is evaluated in a single
+        pass, giving the same values as calling ``calculate()`` on each
+        scenario individually.
+        
+        Args:
+            property_price: Purchase price(s) of the property.
+            down_payment: Down payment amount(s).
+            available_cash: Total cash available for investment.
+            monthly_income: Monthly net income.
+            monthly_available: Monthly amount available for investment.
+            mortgage_term_years: Mortgage duration(s) in years.
+            years_until_sale: Years until the property is sold.
+            urban_renewal_value: Urban renewal value(s) (capped at 400,000).
+            is_first_house: Whether each scenario is a first house.
+            improvement_costs: Improvement costs deductible from capital gains.
+            assumptions: Market assumptions shared by all scenarios
+                (uses defaults if not provided).
+            restrictions: Investment restrictions shared by all scenarios
+                (uses defaults if not provided).
+        
+        Returns:
+            ScenarioResultBatch with one array element per scenario.
+        
+        Raises:
+            ValueError: If any scenario has invalid inputs (same rules as
+                ScenarioInputs).
+        
+        Example:
+            >>> batch = ScenarioCalculator.calculate_batch(
+            ...     property_price=2_000_000,
+            ...     down_payment=np.linspace(500_000, 2_000_000, 100),
+            ...     available_cash=2_000_000,
+            ...     monthly_income=50_000,
+            ...     monthly_available=10_000,
+            ...     mortgage_term_years=20,
+            ...     years_until_sale=15,
+            ... )
+            >>> best = batch.total_profit.argmax()
+        """
+        if assumptions is None:
+            assumptions = _DEFAULT_ASSUMPTIONS
+        if restrictions is None:
+            restrictions = _DEFAULT_RESTRICTIONS
+        
+        return _calculate_batch(
+            property_price=property_price,
+            down_payment=down_payment,
+            available_cash=available_cash,
+            monthly_income=monthly_income,
+            monthly_available=monthly_available,
+            mortgage_term_years=mortgage_term_years,
+            years_until_sale=years_until_sale,
+            urban_renewal_value=urban_renewal_value,
+            is_first_house=is_first_house,
+            improvement_costs=improvement_costs,
+            rental_yield=assumptions.rental_yield,
+            mortgage_rate=assumptions.mortgage_rate,
+            early_repayment_rate=assumptions.early_repayment_rate,
+            appreciation_rate=assumptions.appreciation_rate,
+            portfolio_return_rate=assumptions.portfolio_return_rate,
+            capital_gains_tax_rate=assumptions.capital_gains_tax_rate,
+            restrictions=restrictions,
+        )
+    
+    @classmethod
+    def calculate_records(
+        cls,
+        records: "np.ndarray",
+        assumptions: Optional[InvestmentAssumptions] = None,
+        restrictions: Optional[InvestmentRestrictions] = None,
+    ) -> ScenarioResultBatch:
+        """Calculate a batch of scenarios stored as a numpy structured array.
+        
+        Each column must be named after a ScenarioInputs field; optional
+        fields may be omitted and fall back to their defaults.
+        
+        Args:
+            records: Structured array (or recarray) with one row per scenario.
+            assumptions: Market assumptions shared by all scenarios
+                (uses defaults if not provided).
+            restrictions: Investment restrictions shared by all scenarios
+                (uses defaults if not provided).
+        
+        Returns:
+            ScenarioResultBatch with one array element per row.
+        
+        Raises:
+            ValueError: If a column does not match a ScenarioInputs field.
+        """
+        input_names = {f.name for f in fields(ScenarioInputs)}
+        unknown = [name for name in records.dtype.names if name not in input_names]
+        if unknown:
+            raise ValueError(f"Unknown scenario columns: {', '.join(unknown)}")
+        
+        return cls.calculate_batch(
+            **{name: records[name] for name in records.dtype.names},
+            assumptions=assumptions,
+            restrictions=restrictions,
+        )
+    
+    def calculate_sensitivity(self, field: str, values: "np.ndarray") -> ScenarioResultBatch:
+        """Sweep one input or assumption while holding the rest of the scenario fixed.
+        
+        The chosen field is replaced by ``values`` and the whole sweep is
+        evaluated in one vectorized pass instead of building a calculator
+        per point.
+        
+        Args:
+            field: Name of a ScenarioInputs field or a market assumption used
+                by the calculation (e.g. "mortgage_rate").
+            values: Array (or sequence) of values to sweep the field over.
+        
+        Returns:
+            ScenarioResultBatch with one array element per value.
+        
+        Raises:
+            ValueError: If field is not a sweepable input or assumption.
+        
+        Example:
+            >>> sweep = calculator.calculate_sensitivity(
+            ...     "mortgage_rate", np.linspace(0.03, 0.07, 41)
+            ... )
+            >>> sweep.total_profit
+        """
+        params = {f.name: getattr(self.inputs, f.name) for f in fields(ScenarioInputs)}
+        params.update(
+            {name: getattr(self.assumptions, name) for name in _SWEEPABLE_ASSUMPTIONS}
+        )
+        if field not in params:
+            raise ValueError(f"Unknown scenario field: {field}")
+        params[field] = values
+        
+        return _calculate_batch(**params, restrictions=self.restrictions)
+
+
+def _calculate_batch(
+    *,
+    property_price,
+    down_payment,
+    available_cash,
+    monthly_income,
+    monthly_available,
+    mortgage_term_years,
+    years_until_sale,
+    urban_renewal_value,
+    is_first_house,
+    improvement_costs,
+    rental_yield,
+    mortgage_rate,
+    early_repayment_rate,
+    appreciation_rate,
+    portfolio_return_rate,
+    capital_gains_tax_rate,
+    restrictions: InvestmentRestrictions,
+) -> ScenarioResultBatch:
+    """Vectorized core of ScenarioCalculator.calculate_batch.
+    
+    Every input and assumption field may be a scalar or an array; each
+    expression mirrors the corresponding scalar ``calculate_*`` method.
+    NumPy is imported here so the scalar path does not pay for it at import.
+    """
+    import numpy as np
+    
+    (
+        price, down, cash, income, available, term, years,
+        urban_renewal, first_house, improvements,
+        rental_yield, mortgage_rate, early_repayment_rate,
+        appreciation_rate, portfolio_return_rate, capital_gains_tax_rate,
+    ) = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+            property_price, down_payment, available_cash, monthly_income,
+            monthly_available, mortgage_term_years, years_until_sale,
+            urban_renewal_value, is_first_house, improvement_costs,
+            rental_yield, mortgage_rate, early_repayment_rate,
+            appreciation_rate, portfolio_return_rate, capital_gains_tax_rate,
+        )
+    ))
+    first_house = first_house.astype(bool)
+    
+    # Same validation and capping as ScenarioInputs.__post_init__
+    urban_renewal = np.minimum(urban_renewal, 400_000)
+    for invalid, message in (
+        (price <= 0, "property_price must be positive"),
+        (down < 0, "down_payment cannot be negative"),
+        (cash < 0, "available_cash cannot be negative"),
+        (term <= 0, "mortgage_term_years must be positive"),
+        (years <= 0, "years_until_sale must be positive"),
+        (income <= 0, "monthly_income must be positive"),
+        (improvements < 0, "improvement_costs cannot be negative"),
+    ):
+        if invalid.any():
+            raise ValueError(message)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Loan metrics
+        has_loan = (price - down) > 0
+        loan_amount = np.where(has_loan, price - down, 0.0)
+        leverage_ratio = loan_amount / price
+        equity_ratio = 1 - leverage_ratio
+        leverage_multiplier = np.where(
+            has_loan,
+            np.where(equity_ratio > 0, 1 / equity_ratio, np.inf),
+            1.0,
+        )
+        num_payments = term * 12
+        # Closed-form annuity (as in _loan_core); zero loans fall out as a zero
+        # payment without a separate branch
+        monthly_mortgage_rate = mortgage_rate / 12
+        mortgage_growth = (1 + monthly_mortgage_rate) ** num_payments
+        monthly_payment = np.where(
+            monthly_mortgage_rate == 0,
+            loan_amount / num_payments,
+            loan_amount * monthly_mortgage_rate * mortgage_growth / (mortgage_growth - 1),
+        )
+        total_payments = monthly_payment * num_payments
+        total_interest = total_payments - loan_amount
+        avg_monthly_interest = total_interest / num_payments
+        mortgage_to_income_ratio = monthly_payment / income
+        
+        # Cash flow metrics
+        monthly_rent = price * rental_yield / 12
+        cash_flow_yield = (monthly_rent * 12) / price
+        monthly_net_cash_flow = monthly_rent - monthly_payment
+        monthly_interest_flow = monthly_rent - avg_monthly_interest
+        avg_principal_payment = np.where(has_loan, -loan_amount / num_payments, 0.0)
+        leveraged_rental_yield = cash_flow_yield * leverage_multiplier
+        net_leveraged_yield = np.where(
+            has_loan, leveraged_rental_yield - mortgage_rate, leveraged_rental_yield
+        )
+        
+        # Appreciation metrics
+        appreciation_growth = _growth_array(appreciation_rate, years)
+        property_appreciation = price * appreciation_growth
+        urban_renewal_appreciation = urban_renewal * appreciation_growth
+        total_appreciation = urban_renewal + property_appreciation + urban_renewal_appreciation
+        sale_value = price + total_appreciation
+        total_return_rate = (sale_value / price) - 1
+        annualized_return = np.where(
+            total_return_rate == 0, 0.0, _growth_array(total_return_rate, 1 / years)
+        )
+        leveraged_return = annualized_return * leverage_multiplier
+        net_annual_return = np.where(
+            has_loan,
+            leveraged_return + leveraged_rental_yield - mortgage_rate,
+            leveraged_return + leveraged_rental_yield,
+        )
+        
+        # Early repayment metrics (only when selling before the term ends)
+        early_sale = has_loan & (years < term)
+        remaining_mortgage = np.where(early_sale, (term - years) / term * total_payments, 0.0)
+        remaining_months = np.where(early_sale, (term - years) * 12, 0.0)
+        # Same closed form as the scalar path, with (1+r)**-(n-k) from the
+        # payment's growth term
+        pv_current = _annuity_pv_array(
+            monthly_mortgage_rate,
+            remaining_months,
+            monthly_payment,
+            (1 + monthly_mortgage_rate) ** (years * 12) / mortgage_growth,
+        )
+        monthly_early_rate = early_repayment_rate / 12
+        pv_new = _annuity_pv_array(
+            monthly_early_rate,
+            remaining_months,
+            monthly_payment,
+            (1 + monthly_early_rate) ** -remaining_months,
+        )
+        early_repayment_penalty = np.where(
+            early_sale, np.maximum(0.0, pv_current - pv_new), 0.0
+        )
+        total_debt_to_bank = remaining_mortgage + early_repayment_penalty
+        proceeds_minus_debt = sale_value - total_debt_to_bank
+        net_gain_property = proceeds_minus_debt - down
+        
+        # Portfolio metrics
+        months = years * 12
+        cash_in_portfolio = cash - down
+        portfolio_initial_growth = cash_in_portfolio * (1 + portfolio_return_rate) ** years
+        monthly_deposits = available + monthly_net_cash_flow
+        # Closed-form future value of the deposit annuity, as in calculate_portfolio
+        monthly_portfolio_rate = portfolio_return_rate / 12
+        accumulated_deposits = np.where(
+            monthly_portfolio_rate == 0,
+            monthly_deposits * months,
+            monthly_deposits * _growth_array(monthly_portfolio_rate, months)
+            / monthly_portfolio_rate,
+        )
+        total_portfolio_value = portfolio_initial_growth + accumulated_deposits
+        total_gains = (
+            (accumulated_deposits - monthly_deposits * months) +
+            (portfolio_initial_growth - cash_in_portfolio)
+        )
+        portfolio_tax = np.where(total_gains > 0, total_gains * capital_gains_tax_rate, 0.0)
+        portfolio_after_tax = total_portfolio_value - portfolio_tax
+        total_contributions = cash_in_portfolio + monthly_deposits * months
+        net_portfolio_profit = portfolio_after_tax - total_contributions
+        
+        # Tax metrics
+        purchase_tax = np.where(
+            first_house,
+            calculate_purchase_tax_batch(price, is_first_house=True),
+            calculate_purchase_tax_batch(price, is_first_house=False),
+        )
+        purchase_tax_rate = purchase_tax / price
+        capital_gains = sale_value - price - purchase_tax - improvements
+        capital_gains_tax = np.where(
+            capital_gains > 0, capital_gains * CAPITAL_GAINS_TAX_RATE, 0.0
+        )
+        total_taxes = purchase_tax + capital_gains_tax
+        net_profit_after_taxes = net_gain_property - total_taxes
+        
+        # Final summary
+        total_value_at_sale = (proceeds_minus_debt - capital_gains_tax) + portfolio_after_tax
+        total_profit = net_profit_after_taxes + net_portfolio_profit
+        value_multiple = total_value_at_sale / cash
+        annual_return = np.where(
+            cash > 0,
+            np.where(value_multiple < 0, np.nan, value_multiple ** (1 / years) - 1),
+            0.0,
+        )
+    
+    # Validation (same rules as validate())
+    is_valid = ~(
+        (down / price < restrictions.min_down_payment_percentage) |
+        (leverage_ratio > restrictions.max_loan_to_value) |
+        (leverage_ratio > restrictions.max_mortgage_percentage) |
+        (mortgage_to_income_ratio > restrictions.max_mortgage_to_income_ratio) |
+        (restrictions.require_positive_cash_flow & (monthly_net_cash_flow < 0)) |
+        (urban_renewal > restrictions.max_urban_renewal_value)
+    )
+    
+    return ScenarioResultBatch(
+        loan_metrics=LoanMetrics(
+            loan_amount=loan_amount,
+            leverage_ratio=leverage_ratio,
+            equity_ratio=equity_ratio,
+            leverage_multiplier=leverage_multiplier,
+            monthly_payment=monthly_payment,
+            total_payments=total_payments,
+            total_interest=total_interest,
+            avg_monthly_interest=avg_monthly_interest,
+            mortgage_to_income_ratio=mortgage_to_income_ratio,
+        ),
+        cash_flow_metrics=CashFlowMetrics(
+            monthly_rent=monthly_rent,
+            rental_yield=cash_flow_yield,
+            monthly_net_cash_flow=monthly_net_cash_flow,
+            monthly_interest_flow=monthly_interest_flow,
+            avg_principal_payment=avg_principal_payment,
+            leveraged_rental_yield=leveraged_rental_yield,
+            net_leveraged_yield=net_leveraged_yield,
+        ),
+        appreciation_metrics=AppreciationMetrics(
+            property_appreciation=property_appreciation,
+            urban_renewal_appreciation=urban_renewal_appreciation,
+            total_appreciation=total_appreciation,
+            sale_value=sale_value,
+            total_return_rate=total_return_rate,
+            annualized_return=annualized_return,
+            leveraged_return=leveraged_return,
+            net_annual_return=net_annual_return,
+        ),
+        early_repayment_metrics=EarlyRepaymentMetrics(
+            remaining_mortgage=remaining_mortgage,
+            early_repayment_penalty=early_repayment_penalty,
+            total_debt_to_bank=total_debt_to_bank,
+            proceeds_minus_debt=proceeds_minus_debt,
+            net_gain_property=net_gain_property,
+        ),
+        portfolio_metrics=PortfolioMetrics(
+            cash_in_portfolio=cash_in_portfolio,
+            portfolio_initial_growth=portfolio_initial_growth,
+            monthly_deposits=monthly_deposits,
+            accumulated_deposits=accumulated_deposits,
+            total_portfolio_value=total_portfolio_value,
+            portfolio_after_tax=portfolio_after_tax,
+            net_portfolio_profit=net_portfolio_profit,
+        ),
+        tax_metrics=TaxMetrics(
+            purchase_tax=purchase_tax,
+            purchase_tax_rate=purchase_tax_rate,
+            capital_gains=capital_gains,
+            capital_gains_tax=capital_gains_tax,
+            total_taxes=total_taxes,
+            net_profit_after_taxes=net_profit_after_taxes,
+        ),
+        total_value_at_sale=total_value_at_sale,
+        total_profit=total_profit,
+        annual_return=annual_return,
+        is_valid=is_valid,
+    )
@@ -3,11 +3,15 @@
 This module contains all dataclasses used in the investment scenario calculations.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class InvestmentAssumptions:
     """Market assumptions with default values.
     
@@ -45,7 +49,7 @@ class InvestmentAssumptions:
     capital_gains_tax_rate: float = 0.25  # 25% capital gains tax
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioInputs:
     """Property-specific inputs that must be provided by the user.
     
@@ -91,8 +95,8 @@ class ScenarioInputs:
     
     def __post_init__(self) -> None:
         """Validate and cap values after initialization."""
-        # Cap urban renewal value at 400,000
-        self.urban_renewal_value = min(self.urban_renewal_value, 400_000)
+        # Cap urban renewal value at 400,000 (frozen, so bypass __setattr__)
+        object.__setattr__(self, "urban_renewal_value", min(self.urban_renewal_value, 400_000))
         
         # Validate positive values
         if self.property_price <= 0:
@@ -128,9 +132,52 @@ class ScenarioInputs:
             Mortgage amount.
         """
         return self.property_price - self.down_payment
+    
+    def to_record(self) -> "np.void":
+        """Return these inputs as a single structured-array record.
+        
+        Returns:
+            numpy record with one named column per field.
+        """
+        return ScenarioInputs.to_records([self])[0]
+    
+    @staticmethod
+    def to_records(inputs: Sequence["ScenarioInputs"]) -> "np.ndarray":
+        """Stack many scenarios into one structured array (structure of arrays).
+        
+        The result can be passed directly to
+        ``ScenarioCalculator.calculate_records``.
+        
+        Args:
+            inputs: Scenario inputs to stack.
+        
+        Returns:
+            Structured numpy array with one row per scenario.
+        """
+        import numpy as np
+        
+        names = [f.name for f in fields(ScenarioInputs)]
+        return np.array(
+            [tuple(getattr(item, name) for name in names) for item in inputs],
+            dtype=scenario_inputs_dtype(),
+        )
+
 
+@lru_cache(maxsize=None)
+def scenario_inputs_dtype() -> "np.dtype":
+    """Structured dtype mirroring the ScenarioInputs fields.
+    
+    Returns:
+        numpy dtype with float64 money fields, int64 year counts and a
+        boolean ``is_first_house`` column.
+    """
+    import numpy as np
+    
+    codes = {int: "i8", bool: "?"}
+    return np.dtype([(f.name, codes.get(f.type, "f8")) for f in fields(ScenarioInputs)])
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class InvestmentRestrictions:
     """Investment validation rules and constraints.
     
@@ -153,7 +200,7 @@ class InvestmentRestrictions:
     require_positive_cash_flow: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoanMetrics:
     """Calculated loan-related metrics.
     
@@ -180,7 +227,7 @@ class LoanMetrics:
     mortgage_to_income_ratio: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CashFlowMetrics:
     """Calculated cash flow metrics.
     
@@ -203,7 +250,7 @@ class CashFlowMetrics:
     net_leveraged_yield: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppreciationMetrics:
     """Calculated appreciation and return metrics.
     
@@ -228,7 +275,7 @@ class AppreciationMetrics:
     net_annual_return: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EarlyRepaymentMetrics:
     """Early mortgage repayment metrics.
     
@@ -247,7 +294,7 @@ class EarlyRepaymentMetrics:
     net_gain_property: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaxMetrics:
     """Tax-related calculations for the investment scenario.
     
@@ -267,7 +314,7 @@ class TaxMetrics:
     net_profit_after_taxes: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PortfolioMetrics:
     """Alternative investment portfolio metrics.
     
@@ -293,7 +340,7 @@ class PortfolioMetrics:
     net_portfolio_profit: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioResult:
     """Complete results from scenario calculation.
     
@@ -333,3 +380,81 @@ class ScenarioResult:
     is_valid: bool = True
     validation_errors: List[str] = field(default_factory=list)
 
+
+
+@dataclass(slots=True)
+class ScenarioResultBatch:
+    """Results for many scenarios computed at once (structure of arrays).
+    
+    Mirrors ScenarioResult, but every numeric field of the metric
+    dataclasses holds a 1-D numpy array with one element per scenario,
+    so ``batch.loan_metrics.monthly_payment[i]`` corresponds to
+    ``result_i.loan_metrics.monthly_payment``.
+    
+    Attributes:
+        loan_metrics: Loan metrics with array-valued fields.
+        cash_flow_metrics: Cash flow metrics with array-valued fields.
+        appreciation_metrics: Appreciation metrics with array-valued fields.
+        early_repayment_metrics: Early repayment metrics with array-valued fields.
+        portfolio_metrics: Portfolio metrics with array-valued fields.
+        tax_metrics: Tax metrics with array-valued fields.
+        total_value_at_sale: Total value at time of sale per scenario.
+        total_profit: Total profit per scenario (after taxes).
+        annual_return: Annualized return rate per scenario.
+        is_valid: Boolean array, True where the scenario passes all restrictions.
+    """
+    
+    loan_metrics: LoanMetrics
+    cash_flow_metrics: CashFlowMetrics
+    appreciation_metrics: AppreciationMetrics
+    early_repayment_metrics: EarlyRepaymentMetrics
+    portfolio_metrics: PortfolioMetrics
+    tax_metrics: TaxMetrics
+    
+    # Final summary
+    total_value_at_sale: "np.ndarray"
+    total_profit: "np.ndarray"
+    annual_return: "np.ndarray"
+    
+    # Validation
+    is_valid: "np.ndarray"
+    
+    def __len__(self) -> int:
+        """Return the number of scenarios in the batch."""
+        return len(self.total_profit)
+    
+    def to_records(self) -> "np.ndarray":
+        """Flatten the batch into a structured array with one row per scenario.
+        
+        Metric field names are unique across the metric dataclasses, so each
+        becomes a top-level column alongside the summary fields. The result
+        can be passed straight to ``pandas.DataFrame.from_records``.
+        
+        Returns:
+            Structured numpy array of length ``len(self)``.
+        """
+        import numpy as np
+        
+        columns = {}
+        for metrics in (
+            self.loan_metrics,
+            self.cash_flow_metrics,
+            self.appreciation_metrics,
+            self.early_repayment_metrics,
+            self.portfolio_metrics,
+            self.tax_metrics,
+        ):
+            for metric_field in fields(metrics):
+                columns[metric_field.name] = getattr(metrics, metric_field.name)
+        columns["total_value_at_sale"] = self.total_value_at_sale
+        columns["total_profit"] = self.total_profit
+        columns["annual_return"] = self.annual_return
+        columns["is_valid"] = self.is_valid
+        
+        size = len(self)
+        records = np.empty(
+            size, dtype=[(name, np.asarray(values).dtype) for name, values in columns.items()]
+        )
+        for name, values in columns.items():
+            records[name] = np.broadcast_to(values, size)
+        return records
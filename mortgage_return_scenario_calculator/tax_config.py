@@ -11,11 +11,15 @@ the latest rates from the Israel Tax Authority (רשות המסים).
 Last Updated: 2025
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, List, Tuple
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class TaxBracket:
     """Represents a single tax bracket.
     
@@ -93,6 +97,90 @@ ADDITIONAL_HOUSE_BRACKETS: List[TaxBracket] = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class _BracketTable:
+    """Progressive brackets flattened into a lookup table.
+    
+    Tax for a value is the precomputed tax up to the lower edge of its
+    bracket plus the marginal rate on the remainder, so a lookup is one
+    binary search instead of a walk over every bracket.
+    
+    Attributes:
+        edges: Lower bound of each bracket, ascending.
+        rates: Marginal rate of each bracket.
+        base_tax: Total tax on a value equal to each lower bound.
+    """
+    edges: Tuple[float, ...]
+    rates: Tuple[float, ...]
+    base_tax: Tuple[float, ...]
+    
+    @classmethod
+    def from_brackets(cls, brackets: List[TaxBracket]) -> "_BracketTable":
+        """Build a table from contiguous brackets.
+        
+        Args:
+            brackets: Tax brackets ordered by min_value, starting at 0.
+        
+        Returns:
+            _BracketTable for the brackets.
+        
+        Raises:
+            ValueError: If the brackets do not start at 0 or leave gaps.
+        """
+        if brackets[0].min_value != 0:
+            raise ValueError("Tax brackets must start at 0")
+        base_tax = [0.0]
+        for bracket, following in zip(brackets, brackets[1:]):
+            if bracket.max_value != following.min_value:
+                raise ValueError(
+                    f"Tax brackets must be contiguous: {bracket.max_value} != {following.min_value}"
+                )
+            base_tax.append(base_tax[-1] + (bracket.max_value - bracket.min_value) * bracket.rate)
+        return cls(
+            edges=tuple(bracket.min_value for bracket in brackets),
+            rates=tuple(bracket.rate for bracket in brackets),
+            base_tax=tuple(base_tax),
+        )
+    
+    def tax(self, value: float) -> float:
+        """Look up the progressive tax on a positive value.
+        
+        Args:
+            value: Property value (must be positive).
+        
+        Returns:
+            Tax amount in ILS.
+        """
+        idx = bisect_right(self.edges, value) - 1
+        return self.base_tax[idx] + (value - self.edges[idx]) * self.rates[idx]
+    
+    def tax_array(self, values: "np.ndarray") -> "np.ndarray":
+        """Look up the progressive tax for an array of values.
+        
+        One ``searchsorted`` over the edges replaces a pass per bracket;
+        non-positive values are taxed at 0.
+        
+        Args:
+            values: Property values.
+        
+        Returns:
+            Tax amount for each value.
+        """
+        import numpy as np
+        
+        values = np.maximum(values, 0.0)
+        edges = np.asarray(self.edges, dtype=float)
+        idx = np.searchsorted(edges, values, side="right") - 1
+        return (
+            np.asarray(self.base_tax)[idx] +
+            (values - edges[idx]) * np.asarray(self.rates)[idx]
+        )
+
+
+_FIRST_HOUSE_TABLE = _BracketTable.from_brackets(FIRST_HOUSE_BRACKETS)
+_ADDITIONAL_HOUSE_TABLE = _BracketTable.from_brackets(ADDITIONAL_HOUSE_BRACKETS)
+
+
 def calculate_purchase_tax(
     property_value: float,
     is_first_house: bool = True
@@ -100,7 +188,8 @@ def calculate_purchase_tax(
     """Calculate purchase tax (מס רכישה) based on property value.
     
     Purchase tax is calculated using progressive brackets. Each bracket
-    applies only to the portion of the value that falls within that bracket.
+    applies only to the portion of the value that falls within that bracket;
+    the brackets are precomputed into a lookup table at import time.
     
     Reference: https://www.kolzchut.org.il/he/חישוב_מס_רכישה
     
@@ -125,30 +214,31 @@ def calculate_purchase_tax(
     if property_value <= 0:
         return 0.0
     
-    brackets = FIRST_HOUSE_BRACKETS if is_first_house else ADDITIONAL_HOUSE_BRACKETS
+    table = _FIRST_HOUSE_TABLE if is_first_house else _ADDITIONAL_HOUSE_TABLE
+    return table.tax(property_value)
+
+
+def calculate_purchase_tax_batch(
+    property_values: "np.ndarray",
+    is_first_house: bool = True
+) -> "np.ndarray":
+    """Calculate purchase tax for many property values at once.
     
-    total_tax = 0.0
+    Vectorized counterpart of calculate_purchase_tax; NumPy is imported on
+    first use.
     
-    for bracket in brackets:
-        # Skip brackets below the property value
-        if property_value <= bracket.min_value:
-            break
-        
-        # Calculate the upper limit of this bracket
-        bracket_max = bracket.max_value if bracket.max_value is not None else float('inf')
-        
-        # Calculate how much of the property value falls in this bracket
-        bracket_start = bracket.min_value
-        bracket_end = min(property_value, bracket_max)
-        
-        # Amount taxed in this bracket
-        amount_in_bracket = bracket_end - bracket_start
-        
-        if amount_in_bracket > 0:
-            tax_for_bracket = amount_in_bracket * bracket.rate
-            total_tax += tax_for_bracket
+    Args:
+        property_values: Array (or sequence) of property values.
+        is_first_house: True if every value is a first house, False if
+            every value is an additional property.
     
-    return total_tax
+    Returns:
+        Array of purchase tax amounts in ILS.
+    """
+    import numpy as np
+    
+    table = _FIRST_HOUSE_TABLE if is_first_house else _ADDITIONAL_HOUSE_TABLE
+    return table.tax_array(np.asarray(property_values, dtype=float))
 
 
 def calculate_purchase_tax_rate(
@@ -203,3 +293,34 @@ def calculate_capital_gains_tax(
     
     return capital_gain * CAPITAL_GAINS_TAX_RATE
 
+
+
+def calculate_capital_gains_tax_batch(
+    sale_prices: "np.ndarray",
+    purchase_prices: "np.ndarray",
+    purchase_taxes_paid: "np.ndarray" = 0.0,
+    improvement_costs: "np.ndarray" = 0.0
+) -> "np.ndarray":
+    """Calculate capital gains tax for many sales at once.
+    
+    Vectorized counterpart of calculate_capital_gains_tax; arguments
+    broadcast against each other and NumPy is imported on first use.
+    
+    Args:
+        sale_prices: Prices at which the properties are sold.
+        purchase_prices: Original purchase prices.
+        purchase_taxes_paid: Purchase taxes paid when buying (deducted).
+        improvement_costs: Costs of improvements made to the properties.
+    
+    Returns:
+        Array of capital gains tax amounts in ILS.
+    """
+    import numpy as np
+    
+    capital_gains = (
+        np.asarray(sale_prices, dtype=float)
+        - np.asarray(purchase_prices, dtype=float)
+        - np.asarray(purchase_taxes_paid, dtype=float)
+        - np.asarray(improvement_costs, dtype=float)
+    )
+    return np.maximum(capital_gains, 0.0) * CAPITAL_GAINS_TAX_RATE
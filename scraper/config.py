@@ -7,7 +7,8 @@ and validation for scraper settings.
 
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 
 # City data mapping: name -> {id, bbox}
@@ -103,9 +104,12 @@ CITY_DATA: Dict[str, Dict] = {
 }
 
 # Legacy mapping for backwards compatibility
-CITY_ID_MAP: Dict[str, int] = {
+# Exposed read-only so callers can share it without defensive copies;
+# get_city_id reads the underlying dict directly.
+_CITY_ID_MAP_RAW: Dict[str, int] = {
     city: data["id"] for city, data in CITY_DATA.items()
 }
+CITY_ID_MAP: Mapping[str, int] = MappingProxyType(_CITY_ID_MAP_RAW)
 
 
 @dataclass
@@ -194,12 +198,13 @@ class ScraperConfig:
         Raises:
             ValueError: If city name is not in the mapping.
         """
-        if city_name not in CITY_DATA:
+        city_id = _CITY_ID_MAP_RAW.get(city_name)
+        if city_id is None:
             raise ValueError(
                 f"Unknown city: {city_name}. "
                 f"Available cities: {list(CITY_DATA.keys())}"
             )
-        return CITY_DATA[city_name]["id"]
+        return city_id
 
     def get_city_bbox(self, city_name: str) -> Tuple[float, float, float, float]:
         """
@@ -5,10 +5,11 @@ Handles conversion of Listing objects to pandas DataFrames
 and export to Parquet format with explicit schema definition.
 """
 
+import io
 from dataclasses import asdict, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import pandas as pd
 import pyarrow as pa
@@ -56,6 +57,9 @@ LISTING_SCHEMA = pa.schema([
     ("entrance_date", pa.string()),
 ])
 
+# Column order for DataFrames, matching Listing field order (computed once)
+LISTING_COLUMNS = tuple(f.name for f in fields(Listing))
+
 
 class ParquetExporter:
     """
@@ -83,21 +87,22 @@ class ParquetExporter:
         """
         if not listings:
             # Return empty DataFrame with correct columns
-            column_names = [f.name for f in fields(Listing)]
-            return pd.DataFrame(columns=column_names)
+            return pd.DataFrame(columns=list(LISTING_COLUMNS))
 
         # Convert each listing to dict and create DataFrame
         data = [asdict(listing) for listing in listings]
         df = pd.DataFrame(data)
 
         # Ensure column order matches dataclass field order
-        column_order = [f.name for f in fields(Listing)]
-        df = df[column_order]
+        df = df[list(LISTING_COLUMNS)]
 
         return df
 
     def generate_output_path(
-        self, base_output_path: str, city_name: str, date: Optional[datetime] = None
+        self,
+        base_output_path: Union[str, Path],
+        city_name: str,
+        date: Optional[datetime] = None,
     ) -> Path:
         """
         Generate output path in the format: {base_output_path}/{city_name}/{YYYYMMDD}_{city_name}.parquet
@@ -125,9 +130,9 @@ class ParquetExporter:
     def export(
         self,
         listings: List[Listing],
-        output_path: str,
+        output_path: Union[str, Path],
         city_name: Optional[str] = None,
-        base_output_path: Optional[str] = None,
+        base_output_path: Optional[Union[str, Path]] = None,
         date: Optional[datetime] = None,
     ) -> Path:
         """
@@ -160,21 +165,41 @@ class ParquetExporter:
         # Ensure parent directories exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to DataFrame
-        df = self.to_dataframe(listings)
-
-        if df.empty:
-            # Create empty table with schema for empty DataFrame
-            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
-        else:
-            # Convert DataFrame to PyArrow Table with explicit schema
-            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
-
         # Write to Parquet with schema
-        pq.write_table(table, str(path))
+        pq.write_table(self.to_table(listings), str(path))
 
         return path
 
+    def export_to_buffer(self, listings: List[Listing]) -> bytes:
+        """
+        Export listings to in-memory Parquet bytes with explicit schema.
+
+        Useful when the Parquet payload is consumed directly (e.g. uploaded
+        or read back) and touching the filesystem is unnecessary.
+
+        Args:
+            listings: List of Listing dataclass instances to export.
+
+        Returns:
+            Parquet file contents as bytes.
+        """
+        buffer = io.BytesIO()
+        pq.write_table(self.to_table(listings), buffer)
+        return buffer.getvalue()
+
+    def to_table(self, listings: List[Listing]) -> pa.Table:
+        """
+        Convert listings to a PyArrow Table using the listing schema.
+
+        Args:
+            listings: List of Listing dataclass instances.
+
+        Returns:
+            PyArrow Table with columns typed according to LISTING_SCHEMA.
+        """
+        df = self.to_dataframe(listings)
+        return pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+
     def get_schema(self) -> pa.Schema:
         """
         Get the PyArrow schema used for Parquet exports.
@@ -12,6 +12,12 @@ from scraper.config import ScraperConfig, CITY_ID_MAP
 
 pytestmark = pytest.mark.scraper
 
+# Hebrew city names shared across tests
+TEL_AVIV = "תל אביב"
+HAIFA = "חיפה"
+JERUSALEM = "ירושלים"
+BEER_SHEVA = "באר שבע"
+
 
 class TestScraperConfigDefaults:
     """Test that ScraperConfig has sensible default values."""
@@ -59,7 +65,7 @@ class TestScraperConfigCustomValues:
 
     def test_config_accepts_custom_cities_list(self):
         """Config should accept a custom list of cities."""
-        cities = ["תל אביב", "חיפה", "ירושלים"]
+        cities = [TEL_AVIV, HAIFA, JERUSALEM]
         config = ScraperConfig(cities=cities)
         assert config.cities == cities
 
@@ -137,25 +143,30 @@ class TestScraperConfigCityMapping:
 
     def test_city_id_map_contains_beer_sheva(self):
         """City ID map should contain Beer Sheva."""
-        assert "באר שבע" in CITY_ID_MAP
-        assert CITY_ID_MAP["באר שבע"] == 9000
+        assert BEER_SHEVA in CITY_ID_MAP
+        assert CITY_ID_MAP[BEER_SHEVA] == 9000
 
     def test_city_id_map_contains_tel_aviv(self):
         """City ID map should contain Tel Aviv."""
-        assert "תל אביב" in CITY_ID_MAP
-        assert CITY_ID_MAP["תל אביב"] == 5000
+        assert TEL_AVIV in CITY_ID_MAP
+        assert CITY_ID_MAP[TEL_AVIV] == 5000
 
     def test_city_id_map_contains_major_cities(self):
         """City ID map should contain major Israeli cities."""
-        major_cities = ["ירושלים", "חיפה", "ראשון לציון", "אשדוד"]
+        major_cities = [JERUSALEM, HAIFA, "ראשון לציון", "אשדוד"]
         for city in major_cities:
             assert city in CITY_ID_MAP
 
+    def test_city_id_map_is_read_only(self):
+        """City ID map should reject mutation so it can be shared safely."""
+        with pytest.raises(TypeError):
+            CITY_ID_MAP["עיר חדשה"] = 1
+
     def test_get_city_id_returns_correct_id(self):
         """get_city_id should return the correct city ID."""
         config = ScraperConfig()
-        assert config.get_city_id("באר שבע") == 9000
-        assert config.get_city_id("תל אביב") == 5000
+        assert config.get_city_id(BEER_SHEVA) == 9000
+        assert config.get_city_id(TEL_AVIV) == 5000
 
     def test_get_city_id_raises_for_unknown_city(self):
         """get_city_id should raise ValueError for unknown cities."""
@@ -6,7 +6,7 @@ TDD Phase: RED - Writing tests before implementation.
 Run only scraper tests with: pytest -m scraper
 """
 
-import os
+import io
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -20,13 +20,31 @@ from scraper.models import Listing
 
 pytestmark = pytest.mark.scraper
 
+# Hebrew city names shared across tests
+TEL_AVIV = "תל אביב"
+HAIFA = "חיפה"
+JERUSALEM = "ירושלים"
 
-@pytest.fixture
+# Fixed timestamp for listings that don't care about scrape time,
+# so exported output is identical across runs
+FIXED_TS = datetime(2025, 1, 1, 0, 0, 0)
+
+EXPECTED_COLUMNS = (
+    "city", "url", "scraped_at",
+    "price", "rooms", "floor", "sqm", "sqm_build", "address", "area", "neighborhood",
+    "latitude", "longitude", "asset_type", "description", "images",
+    "total_floors", "year_built", "elevator",
+    "parking", "balconies", "mamad", "storage_unit", "condition",
+    "entrance_date",
+)
+
+
+@pytest.fixture(scope="module")
 def sample_listings():
-    """Create sample listings for testing."""
+    """Create sample listings for testing (read-only, shared per module)."""
     return [
         Listing(
-            city="תל אביב",
+            city=TEL_AVIV,
             url="https://www.yad2.co.il/item/abc123",
             scraped_at=datetime(2025, 12, 12, 10, 30, 0),
             price=2500000,
@@ -48,7 +66,7 @@ def sample_listings():
             entrance_date="גמיש",
         ),
         Listing(
-            city="תל אביב",
+            city=TEL_AVIV,
             url="https://www.yad2.co.il/item/def456",
             scraped_at=datetime(2025, 12, 12, 10, 31, 0),
             price=3200000,
@@ -72,11 +90,21 @@ def sample_listings():
     ]
 
 
+@pytest.fixture(scope="module")
+def exported_sample_bytes(sample_listings):
+    """Export sample listings to Parquet bytes once per module.
+
+    Held in memory rather than on disk so each pytest-xdist worker builds
+    its own copy without coordinating over a shared file.
+    """
+    return ParquetExporter().export_to_buffer(sample_listings)
+
+
 @pytest.fixture
 def listing_with_missing_fields():
     """Create a listing with some optional fields missing."""
     return Listing(
-        city="חיפה",
+        city=HAIFA,
         url="https://www.yad2.co.il/item/xyz789",
         scraped_at=datetime(2025, 12, 12, 11, 0, 0),
         price=1800000,
@@ -88,7 +116,7 @@ def listing_with_missing_fields():
 def temp_output_dir():
     """Create a temporary directory for test outputs."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+        yield Path(tmpdir)
 
 
 class TestParquetExporterConversion:
@@ -107,22 +135,14 @@ class TestParquetExporterConversion:
         exporter = ParquetExporter()
         df = exporter.to_dataframe(sample_listings)
 
-        expected_columns = [
-            "city", "url", "scraped_at",
-            "price", "rooms", "floor", "sqm", "sqm_build", "address", "area", "neighborhood", 
-            "latitude", "longitude", "asset_type", "description", "images",
-            "total_floors", "year_built", "elevator",
-            "parking", "balconies", "mamad", "storage_unit", "condition",
-            "entrance_date"
-        ]
-        assert list(df.columns) == expected_columns
+        assert tuple(df.columns) == EXPECTED_COLUMNS
 
     def test_dataframe_preserves_hebrew_text(self, sample_listings):
         """DataFrame should correctly preserve Hebrew text."""
         exporter = ParquetExporter()
         df = exporter.to_dataframe(sample_listings)
 
-        assert df.iloc[0]["city"] == "תל אביב"
+        assert df.iloc[0]["city"] == TEL_AVIV
         assert df.iloc[0]["neighborhood"] == "הצפון הישן"
 
     def test_dataframe_handles_missing_fields(self, listing_with_missing_fields):
@@ -131,7 +151,7 @@ class TestParquetExporterConversion:
         df = exporter.to_dataframe([listing_with_missing_fields])
 
         assert len(df) == 1
-        assert df.iloc[0]["city"] == "חיפה"
+        assert df.iloc[0]["city"] == HAIFA
         assert pd.isna(df.iloc[0]["rooms"])
         assert pd.isna(df.iloc[0]["floor"])
 
@@ -142,47 +162,38 @@ class TestParquetExporterSave:
     def test_export_creates_parquet_file(self, sample_listings, temp_output_dir):
         """Exporter should create a Parquet file."""
         exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "test_output.parquet")
+        output_path = temp_output_dir / "test_output.parquet"
 
         exporter.export(sample_listings, output_path)
 
-        assert os.path.exists(output_path)
-
-    def test_exported_parquet_readable(self, sample_listings, temp_output_dir):
-        """Exported Parquet file should be readable by pandas."""
-        exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "test_output.parquet")
+        assert output_path.is_file()
 
-        exporter.export(sample_listings, output_path)
-        df_read = pd.read_parquet(output_path)
+    def test_exported_parquet_readable(self, exported_sample_bytes):
+        """Exported Parquet data should be readable by pandas."""
+        df_read = pd.read_parquet(io.BytesIO(exported_sample_bytes))
 
         assert len(df_read) == 2
-        assert df_read.iloc[0]["city"] == "תל אביב"
+        assert df_read.iloc[0]["city"] == TEL_AVIV
 
     def test_export_creates_parent_directories(self, sample_listings, temp_output_dir):
         """Exporter should create parent directories if they don't exist."""
         exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "nested", "dir", "output.parquet")
+        output_path = temp_output_dir / "nested" / "dir" / "output.parquet"
 
         exporter.export(sample_listings, output_path)
 
-        assert os.path.exists(output_path)
+        assert output_path.is_file()
 
 
 class TestParquetExporterSchema:
     """Test Parquet schema definition."""
 
-    def test_exported_parquet_has_correct_schema(self, sample_listings, temp_output_dir):
-        """Exported Parquet file should have explicitly defined schema."""
+    def test_exported_parquet_has_correct_schema(self, exported_sample_bytes):
+        """Exported Parquet data should have explicitly defined schema."""
         import pyarrow.parquet as pq
 
-        exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "schema_test.parquet")
-
-        exporter.export(sample_listings, output_path)
-
-        # Read schema from file
-        parquet_file = pq.read_table(output_path)
+        # Read schema from exported bytes
+        parquet_file = pq.read_table(io.BytesIO(exported_sample_bytes))
         schema = parquet_file.schema
 
         # Verify key column types
@@ -191,25 +202,22 @@ class TestParquetExporterSchema:
         assert schema.field("elevator").type == "bool"
         assert str(schema.field("city").type) == "string" or str(schema.field("city").type) == "large_string"
 
-    def test_schema_handles_null_values_correctly(self, temp_output_dir):
+    def test_schema_handles_null_values_correctly(self):
         """Schema should properly handle null values in optional fields."""
-        import pyarrow.parquet as pq
-
         exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "nulls_test.parquet")
 
         # Create listing with many null fields
         listing = Listing(
             city="Test City",
             url="https://test.com",
-            scraped_at=datetime.now(),
+            scraped_at=FIXED_TS,
             # All other fields are None
         )
 
-        exporter.export([listing], output_path)
+        buffer = exporter.export_to_buffer([listing])
 
         # Should be readable without errors
-        df = pd.read_parquet(output_path)
+        df = pd.read_parquet(io.BytesIO(buffer))
         assert len(df) == 1
         assert pd.isna(df.iloc[0]["price"])
         assert pd.isna(df.iloc[0]["elevator"])
@@ -221,30 +229,29 @@ class TestParquetExporterEdgeCases:
     def test_export_empty_listings_creates_empty_file(self, temp_output_dir):
         """Exporter should handle empty listings list gracefully."""
         exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "empty_output.parquet")
+        output_path = temp_output_dir / "empty_output.parquet"
 
         exporter.export([], output_path)
 
-        assert os.path.exists(output_path)
+        assert output_path.is_file()
         df_read = pd.read_parquet(output_path)
         assert len(df_read) == 0
 
-    def test_export_single_listing(self, temp_output_dir):
+    def test_export_single_listing(self):
         """Exporter should handle a single listing."""
         exporter = ParquetExporter()
-        output_path = os.path.join(temp_output_dir, "single_output.parquet")
         single_listing = Listing(
-            city="ירושלים",
+            city=JERUSALEM,
             url="https://www.yad2.co.il/item/single",
-            scraped_at=datetime.now(),
+            scraped_at=FIXED_TS,
             price=1500000,
         )
 
-        exporter.export([single_listing], output_path)
+        buffer = exporter.export_to_buffer([single_listing])
 
-        df_read = pd.read_parquet(output_path)
+        df_read = pd.read_parquet(io.BytesIO(buffer))
         assert len(df_read) == 1
-        assert df_read.iloc[0]["city"] == "ירושלים"
+        assert df_read.iloc[0]["city"] == JERUSALEM
 
 
 class TestParquetExporterStructuredOutput:
@@ -254,7 +261,7 @@ class TestParquetExporterStructuredOutput:
         """generate_output_path should create path in format: {city}/{YYYYMMDD}_{city}.parquet"""
         exporter = ParquetExporter()
         test_date = datetime(2025, 12, 18, 10, 30, 0)
-        path = exporter.generate_output_path("data/output", "תל אביב", test_date)
+        path = exporter.generate_output_path("data/output", TEL_AVIV, test_date)
 
         assert path.parent.name == "תל_אביב"
         assert path.name == "20251218_תל_אביב.parquet"
@@ -273,7 +280,7 @@ class TestParquetExporterStructuredOutput:
     def test_generate_output_path_uses_current_date_if_none(self):
         """generate_output_path should use current date if date is None."""
         exporter = ParquetExporter()
-        path = exporter.generate_output_path("data/output", "ירושלים")
+        path = exporter.generate_output_path("data/output", JERUSALEM)
 
         # Should use today's date
         today = datetime.now().strftime("%Y%m%d")
@@ -288,7 +295,7 @@ class TestParquetExporterStructuredOutput:
         output_path = exporter.export(
             sample_listings,
             output_path="",  # Ignored in structured mode
-            city_name="תל אביב",
+            city_name=TEL_AVIV,
             base_output_path=temp_output_dir,
             date=test_date,
         )
@@ -311,7 +318,7 @@ class TestParquetExporterStructuredOutput:
         path1 = exporter.export(
             sample_listings[:1],  # One listing
             output_path="",
-            city_name="תל אביב",
+            city_name=TEL_AVIV,
             base_output_path=temp_output_dir,
             date=test_date,
         )
@@ -320,7 +327,7 @@ class TestParquetExporterStructuredOutput:
         path2 = exporter.export(
             sample_listings,  # Two listings
             output_path="",
-            city_name="תל אביב",
+            city_name=TEL_AVIV,
             base_output_path=temp_output_dir,
             date=test_date,
         )
@@ -0,0 +1,42 @@
+"""Shared fixtures for the calculator tests."""
+
+import pytest
+
+from mortgage_return_scenario_calculator import ScenarioInputs
+
+
+# Mortgaged 2M first house sold at the end of a 10-year term
+BASE_INPUTS_KWARGS = dict(
+    property_price=2_000_000,
+    down_payment=1_000_000,
+    available_cash=2_000_000,
+    monthly_income=30_000,
+    monthly_available=10_000,
+    mortgage_term_years=10,
+    years_until_sale=10,
+)
+
+
+@pytest.fixture(scope="module")
+def base_inputs_kwargs():
+    """Keyword arguments for the base scenario, for tests that build inputs directly."""
+    return dict(BASE_INPUTS_KWARGS)
+
+
+@pytest.fixture(scope="session")
+def make_inputs():
+    """Factory for ScenarioInputs that overrides the base scenario.
+    
+    Inputs are frozen, so identical requests share one memoized instance.
+    """
+    cache = {}
+    
+    def _make_inputs(**overrides):
+        kwargs = {**BASE_INPUTS_KWARGS, **overrides}
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = ScenarioInputs(**kwargs)
+        return cache[key]
+    
+    return _make_inputs
+
@@ -2,6 +2,9 @@
 
 Run only calculator tests with: pytest -m calculator
 """
+from dataclasses import fields, replace
+
+import numpy as np
 import pytest
 
 from mortgage_return_scenario_calculator import (
@@ -9,45 +12,45 @@ from mortgage_return_scenario_calculator import (
     ScenarioInputs,
     InvestmentAssumptions,
     InvestmentRestrictions,
+    Violation,
 )
+from mortgage_return_scenario_calculator.financial import calculate_pmt
 from mortgage_return_scenario_calculator.models import TaxMetrics
 
 
 pytestmark = pytest.mark.calculator
 
+# Growth factor for 4% annual appreciation over 10 years
+GROWTH_4PCT_10_YEARS = 1.04 ** 10
+
 
 class TestScenarioCalculatorInit:
     """Tests for ScenarioCalculator initialization."""
     
-    def test_basic_initialization(self):
+    def test_basic_initialization(self, make_inputs):
         """Test basic calculator initialization."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         
         calculator = ScenarioCalculator(inputs)
         
         assert calculator.inputs == inputs
         assert isinstance(calculator.assumptions, InvestmentAssumptions)
         assert isinstance(calculator.restrictions, InvestmentRestrictions)
+        assert calculator.assumptions == InvestmentAssumptions()
+    
+    def test_default_assumptions_are_shared(self, make_inputs):
+        """Test calculators without explicit assumptions share one default."""
+        inputs = make_inputs()
+        
+        first = ScenarioCalculator(inputs)
+        second = ScenarioCalculator(inputs)
+        
+        assert first.assumptions is second.assumptions
+        assert first.restrictions is second.restrictions
     
-    def test_custom_assumptions(self):
+    def test_custom_assumptions(self, make_inputs):
         """Test calculator with custom assumptions."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         assumptions = InvestmentAssumptions(
             rental_yield=0.03,
             mortgage_rate=0.05,
@@ -58,39 +61,23 @@ class TestScenarioCalculatorInit:
         assert calculator.assumptions.rental_yield == 0.03
         assert calculator.assumptions.mortgage_rate == 0.05
     
-    def test_monthly_rent_calculation_on_init(self):
+    def test_monthly_rent_calculation_on_init(self, make_inputs):
         """Test monthly rent is calculated on initialization."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         assumptions = InvestmentAssumptions(rental_yield=0.03)  # 3%
         
         calculator = ScenarioCalculator(inputs, assumptions)
         
         expected_rent = 2_000_000 * 0.03 / 12  # 5,000
-        assert abs(calculator.monthly_rent - expected_rent) < 0.01
+        assert calculator.monthly_rent == pytest.approx(expected_rent, abs=0.01)
 
 
 class TestLoanMetricsCalculation:
     """Tests for loan metrics calculation."""
     
-    def test_basic_loan_metrics(self):
+    def test_basic_loan_metrics(self, make_inputs):
         """Test basic loan metrics calculation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         calculator = ScenarioCalculator(inputs)
         metrics = calculator.calculate_loan_metrics()
         
@@ -141,22 +128,38 @@ class TestLoanMetricsCalculation:
         assert metrics.leverage_ratio == 0.75
         assert metrics.equity_ratio == 0.25
         assert metrics.leverage_multiplier == 4.0
-
-
-class TestCashFlowCalculation:
-    """Tests for cash flow calculation."""
     
-    def test_negative_cash_flow(self):
-        """Test scenario with negative monthly cash flow."""
+    def test_loan_metrics_are_memoized(self, make_inputs):
+        """Test repeated loan-metric calls reuse the first result."""
+        inputs = make_inputs(monthly_income=50_000, mortgage_term_years=20)
+        calculator = ScenarioCalculator(inputs)
+        
+        assert calculator.calculate_loan_metrics() is calculator.calculate_loan_metrics()
+    
+    def test_monthly_payment_matches_pmt(self):
+        """Test closed-form payment matches the Excel-compatible PMT."""
         inputs = ScenarioInputs(
             property_price=2_000_000,
-            down_payment=1_000_000,
+            down_payment=500_000,
             available_cash=2_000_000,
-            monthly_income=30_000,
+            monthly_income=50_000,
             monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
+            mortgage_term_years=20,
+            years_until_sale=15,
         )
+        calculator = ScenarioCalculator(inputs)
+        metrics = calculator.calculate_loan_metrics()
+        
+        expected = calculate_pmt(0.048, 240, 1_500_000)
+        assert metrics.monthly_payment == pytest.approx(expected, abs=1e-6)
+
+
+class TestCashFlowCalculation:
+    """Tests for cash flow calculation."""
+    
+    def test_negative_cash_flow(self, make_inputs):
+        """Test scenario with negative monthly cash flow."""
+        inputs = make_inputs()
         assumptions = InvestmentAssumptions(
             rental_yield=0.025,  # 2.5% - low rent
             mortgage_rate=0.048,
@@ -190,22 +193,25 @@ class TestCashFlowCalculation:
         
         # High rent + low mortgage = positive cash flow
         assert cash_flow.monthly_net_cash_flow > 0
+    
+    def test_full_cash_cash_flow(self, make_inputs):
+        """Test full cash purchase keeps all rent as net cash flow."""
+        inputs = make_inputs(down_payment=2_000_000)
+        calculator = ScenarioCalculator(inputs)
+        loan_metrics = calculator.calculate_loan_metrics()
+        cash_flow = calculator.calculate_cash_flow(loan_metrics)
+        
+        assert cash_flow.monthly_net_cash_flow == calculator.monthly_rent
+        assert cash_flow.avg_principal_payment == 0
+        assert cash_flow.net_leveraged_yield == cash_flow.rental_yield
 
 
 class TestAppreciationCalculation:
     """Tests for appreciation calculation."""
     
-    def test_property_appreciation(self):
+    def test_property_appreciation(self, make_inputs):
         """Test property appreciation calculation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         assumptions = InvestmentAssumptions(appreciation_rate=0.04)
         calculator = ScenarioCalculator(inputs, assumptions)
         
@@ -214,21 +220,12 @@ class TestAppreciationCalculation:
         appreciation = calculator.calculate_appreciation(loan_metrics, cash_flow)
         
         # Property should appreciate at 4% annually over 10 years
-        expected_appreciation = 2_000_000 * ((1.04 ** 10) - 1)
-        assert abs(appreciation.property_appreciation - expected_appreciation) < 1
+        expected_appreciation = 2_000_000 * (GROWTH_4PCT_10_YEARS - 1)
+        assert appreciation.property_appreciation == pytest.approx(expected_appreciation, abs=1)
     
-    def test_urban_renewal_appreciation(self):
+    def test_urban_renewal_appreciation(self, make_inputs):
         """Test urban renewal value appreciation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            urban_renewal_value=400_000,
-        )
+        inputs = make_inputs(urban_renewal_value=400_000)
         assumptions = InvestmentAssumptions(appreciation_rate=0.04)
         calculator = ScenarioCalculator(inputs, assumptions)
         
@@ -240,6 +237,38 @@ class TestAppreciationCalculation:
         assert appreciation.urban_renewal_appreciation > 0
         # Total should include base urban renewal + appreciation
         assert appreciation.total_appreciation > appreciation.property_appreciation
+    
+    def test_total_loss_appreciation_is_finite(self, make_inputs):
+        """Test appreciation_rate <= -1 (outside log1p's domain) still calculates."""
+        inputs = make_inputs()
+        result = ScenarioCalculator(
+            inputs, InvestmentAssumptions(appreciation_rate=-1.0)
+        ).calculate()
+        
+        assert result.appreciation_metrics.sale_value == 0
+        assert result.appreciation_metrics.annualized_return == -1
+        assert np.isfinite(result.total_profit)
+    
+    @pytest.mark.parametrize("rate", [-1.0, -1.5])
+    @pytest.mark.parametrize("years", [10, 9], ids=["even-years", "odd-years"])
+    def test_total_loss_batch_matches_scalar(self, make_inputs, rate, years):
+        """Test the batch path handles appreciation_rate <= -1 like the scalar path."""
+        inputs = make_inputs(years_until_sale=years)
+        
+        sweep = ScenarioCalculator(inputs).calculate_sensitivity("appreciation_rate", [rate])
+        expected = ScenarioCalculator(
+            inputs, InvestmentAssumptions(appreciation_rate=rate)
+        ).calculate()
+        
+        assert sweep.appreciation_metrics.sale_value[0] == pytest.approx(
+            expected.appreciation_metrics.sale_value
+        )
+        assert sweep.total_profit[0] == pytest.approx(expected.total_profit)
+        # An odd horizon raises a negative base to a fractional power: NaN, not complex
+        assert isinstance(expected.appreciation_metrics.annualized_return, float)
+        assert sweep.appreciation_metrics.annualized_return[0] == pytest.approx(
+            expected.appreciation_metrics.annualized_return, nan_ok=True
+        )
 
 
 class TestEarlyRepaymentCalculation:
@@ -292,17 +321,9 @@ class TestEarlyRepaymentCalculation:
 class TestPortfolioCalculation:
     """Tests for portfolio calculation."""
     
-    def test_basic_portfolio(self):
+    def test_basic_portfolio(self, make_inputs):
         """Test basic portfolio calculation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = make_inputs()
         calculator = ScenarioCalculator(inputs)
         
         loan_metrics = calculator.calculate_loan_metrics()
@@ -351,51 +372,102 @@ class TestValidation:
         restrictions = InvestmentRestrictions(max_loan_to_value=0.75)
         calculator = ScenarioCalculator(inputs, restrictions=restrictions)
         
-        is_valid, errors = calculator.validate()
+        violations = calculator.check_restrictions()
         
-        assert is_valid is False
-        assert any("Loan-to-value" in e for e in errors)
+        assert Violation.LOAN_TO_VALUE in violations
+        assert calculator.validate()[0] is False
     
-    def test_requires_positive_cash_flow(self):
+    def test_requires_positive_cash_flow(self, make_inputs):
         """Test validation fails when positive cash flow required but negative."""
+        inputs = make_inputs(monthly_income=50_000)
+        assumptions = InvestmentAssumptions(rental_yield=0.02)  # Low rent
+        restrictions = InvestmentRestrictions(require_positive_cash_flow=True)
+        calculator = ScenarioCalculator(inputs, assumptions, restrictions)
+        
+        violations = calculator.check_restrictions()
+        
+        assert violations == Violation.NEGATIVE_CASH_FLOW
+        assert calculator.validate()[0] is False
+    
+    def test_numpy_scalar_inputs_give_violation_flags(self, make_inputs):
+        """Test NumPy scalar assumptions (e.g. taken from a sweep array) combine flags."""
+        inputs = make_inputs(down_payment=200_000, monthly_income=100_000)
+        assumptions = InvestmentAssumptions(mortgage_rate=np.float64(0.05))
+        restrictions = InvestmentRestrictions(
+            min_down_payment_percentage=0.25, max_loan_to_value=0.75
+        )
+        calculator = ScenarioCalculator(inputs, assumptions, restrictions)
+        
+        violations = calculator.check_restrictions()
+        
+        assert Violation.DOWN_PAYMENT in violations
+        assert Violation.LOAN_TO_VALUE in violations
+    
+    def test_reports_every_violation_in_order(self):
+        """Test validation lists each violated restriction in a stable order."""
         inputs = ScenarioInputs(
             property_price=2_000_000,
-            down_payment=1_000_000,
+            down_payment=200_000,  # 10% down, 90% LTV
             available_cash=2_000_000,
-            monthly_income=50_000,
+            monthly_income=100_000,
             monthly_available=10_000,
             mortgage_term_years=10,
             years_until_sale=10,
         )
-        assumptions = InvestmentAssumptions(rental_yield=0.02)  # Low rent
-        restrictions = InvestmentRestrictions(require_positive_cash_flow=True)
-        calculator = ScenarioCalculator(inputs, assumptions, restrictions)
+        restrictions = InvestmentRestrictions(
+            min_down_payment_percentage=0.25,
+            max_loan_to_value=0.75,
+            max_mortgage_percentage=0.75,
+        )
+        calculator = ScenarioCalculator(inputs, restrictions=restrictions)
         
         is_valid, errors = calculator.validate()
         
         assert is_valid is False
-        assert any("Negative cash flow" in e for e in errors)
+        assert [e.split()[0] for e in errors] == ["Down", "Loan-to-value", "Mortgage"]
+        assert calculator.check_restrictions() == (
+            Violation.DOWN_PAYMENT | Violation.LOAN_TO_VALUE | Violation.MORTGAGE_PERCENTAGE
+        )
+
+
+def _improvements_lower_capital_gains_tax(result):
+    """Improvement costs are deducted, so capital gains tax drops versus none."""
+    without = ScenarioCalculator(replace(result.inputs, improvement_costs=0)).calculate()
+    
+    assert result.tax_metrics.capital_gains < without.tax_metrics.capital_gains
+    assert result.tax_metrics.capital_gains_tax < without.tax_metrics.capital_gains_tax
+
+
+def _taxes_lower_total_profit(result):
+    """Total profit after tax is below the property plus portfolio profit before tax."""
+    profit_before_tax = (
+        result.early_repayment_metrics.net_gain_property +
+        result.portfolio_metrics.net_portfolio_profit
+    )
+    
+    assert result.total_profit < profit_before_tax
+
+
+@pytest.fixture(scope="module")
+def default_inputs(make_inputs):
+    """Mortgaged 2M first house sold at the end of a 10-year term."""
+    return make_inputs(monthly_income=50_000)
+
+
+@pytest.fixture(scope="module")
+def default_result(default_inputs):
+    """Full calculation for default_inputs, computed once per module."""
+    return ScenarioCalculator(default_inputs).calculate()
 
 
 class TestFullCalculation:
     """Tests for complete scenario calculation."""
     
-    def test_full_calculation_returns_result(self):
+    def test_full_calculation_returns_result(self, default_inputs, default_result):
         """Test full calculation returns ScenarioResult."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
-        calculator = ScenarioCalculator(inputs)
-        
-        result = calculator.calculate()
+        result = default_result
         
-        assert result.inputs == inputs
+        assert result.inputs == default_inputs
         assert result.loan_metrics is not None
         assert result.cash_flow_metrics is not None
         assert result.appreciation_metrics is not None
@@ -404,19 +476,9 @@ class TestFullCalculation:
         assert result.total_value_at_sale > 0
         assert result.total_profit != 0  # Could be positive or negative
     
-    def test_result_includes_tax_metrics(self):
+    def test_result_includes_tax_metrics(self, default_result):
         """Test that ScenarioResult includes tax_metrics."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
+        result = default_result
         
         assert isinstance(result.tax_metrics, TaxMetrics)
         assert result.tax_metrics.purchase_tax >= 0
@@ -424,78 +486,61 @@ class TestFullCalculation:
         assert result.tax_metrics.capital_gains_tax >= 0
         assert result.tax_metrics.total_taxes >= 0
     
-    def test_tax_metrics_first_house(self):
-        """Test tax metrics for first house scenario."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            is_first_house=True,
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
-        
-        # First house should have lower purchase tax than additional property
-        assert result.tax_metrics.purchase_tax > 0
-        assert result.tax_metrics.purchase_tax_rate < 0.08  # Less than 8%
-    
-    def test_tax_metrics_additional_property(self):
-        """Test tax metrics for additional property scenario."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            is_first_house=False,  # Additional property
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
+    @pytest.mark.parametrize(
+        "overrides, min_purchase_tax, min_rate, max_rate, case_check",
+        [
+            pytest.param(
+                dict(monthly_income=50_000, is_first_house=True),
+                0, 0.0, 0.08, None,
+                id="first_house",  # Lower purchase tax than additional property
+            ),
+            pytest.param(
+                dict(monthly_income=50_000, is_first_house=False),
+                0, 0.079, 0.081, None,
+                id="additional_property",  # Around 8% for a 2M property
+            ),
+            pytest.param(
+                dict(monthly_income=50_000, improvement_costs=200_000),
+                0, 0.0, 0.08, _improvements_lower_capital_gains_tax,
+                id="with_improvements",
+            ),
+            pytest.param(
+                dict(
+                    property_price=5_000_000,
+                    available_cash=1_500_000,
+                    monthly_income=100_000,
+                    monthly_available=30_000,
+                    mortgage_term_years=25,
+                    years_until_sale=15,
+                ),
+                100_000, 0.0, 0.08, _taxes_lower_total_profit,
+                id="expensive_first_house",  # Substantial tax on a 5M property
+            ),
+        ],
+    )
+    def test_tax_metrics_variants(
+        self, make_inputs, overrides, min_purchase_tax, min_rate, max_rate, case_check
+    ):
+        """Test tax metrics and their effect on profit across tax scenarios."""
+        result = ScenarioCalculator(make_inputs(**overrides)).calculate()
+        tax_metrics = result.tax_metrics
+        
+        assert tax_metrics.purchase_tax > min_purchase_tax
+        assert min_rate < tax_metrics.purchase_tax_rate < max_rate
+        assert tax_metrics.capital_gains >= 0
+        assert tax_metrics.capital_gains_tax >= 0
+        assert tax_metrics.total_taxes > 0
         
-        # Additional property should have higher purchase tax
-        assert result.tax_metrics.purchase_tax > 0
-        # Should be around 8% for 2M property
-        assert abs(result.tax_metrics.purchase_tax_rate - 0.08) < 0.001
-    
-    def test_tax_metrics_with_improvements(self):
-        """Test tax metrics with improvement costs."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            improvement_costs=200_000,
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
+        # Taxes reduce the property profit
+        property_profit_before_tax = result.early_repayment_metrics.net_gain_property
+        assert tax_metrics.net_profit_after_taxes < property_profit_before_tax
         
-        # Capital gains should account for improvements
-        assert result.tax_metrics.capital_gains >= 0
-        # Capital gains tax should be lower with improvements
-        assert result.tax_metrics.capital_gains_tax >= 0
+        if case_check is not None:
+            case_check(result)
     
-    def test_total_profit_includes_taxes(self):
+    def test_total_profit_includes_taxes(self, default_result):
         """Test that total_profit accounts for taxes."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
+        result = default_result
         
         # Total profit should be less than property profit + portfolio profit
         # because taxes are deducted
@@ -505,31 +550,21 @@ class TestFullCalculation:
         
         # Total profit should be profit_before_tax minus taxes
         expected_profit = profit_before_tax - result.tax_metrics.total_taxes
-        assert abs(result.total_profit - expected_profit) < 0.01
+        assert result.total_profit == pytest.approx(expected_profit, abs=0.01)
     
-    def test_calculate_taxes_method(self):
+    def test_calculate_taxes_method(self, default_inputs, default_result):
         """Test calculate_taxes() method directly."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=50_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
-        calculator = ScenarioCalculator(inputs)
+        calculator = ScenarioCalculator(default_inputs)
         
-        # Calculate all metrics needed for tax calculation
-        loan_metrics = calculator.calculate_loan_metrics()
-        cash_flow_metrics = calculator.calculate_cash_flow(loan_metrics)
-        appreciation_metrics = calculator.calculate_appreciation(loan_metrics, cash_flow_metrics)
-        early_repayment_metrics = calculator.calculate_early_repayment(loan_metrics, appreciation_metrics)
+        # Reuse the stage outputs the full calculation already produced
+        appreciation_metrics = default_result.appreciation_metrics
+        early_repayment_metrics = default_result.early_repayment_metrics
         
         # Calculate taxes
         tax_metrics = calculator.calculate_taxes(appreciation_metrics, early_repayment_metrics)
         
         assert isinstance(tax_metrics, TaxMetrics)
+        assert tax_metrics == default_result.tax_metrics
         assert tax_metrics.purchase_tax >= 0
         assert tax_metrics.capital_gains_tax >= 0
         assert tax_metrics.total_taxes == tax_metrics.purchase_tax + tax_metrics.capital_gains_tax
@@ -537,29 +572,6 @@ class TestFullCalculation:
             early_repayment_metrics.net_gain_property - tax_metrics.total_taxes
         )
     
-    def test_tax_impact_on_profit(self):
-        """Test that taxes reduce total profit."""
-        inputs = ScenarioInputs(
-            property_price=5_000_000,
-            down_payment=1_000_000,
-            available_cash=1_500_000,
-            monthly_income=100_000,
-            monthly_available=30_000,
-            mortgage_term_years=25,
-            years_until_sale=15,
-            is_first_house=True,
-        )
-        calculator = ScenarioCalculator(inputs)
-        result = calculator.calculate()
-        
-        # Verify taxes are significant for 5M property
-        assert result.tax_metrics.purchase_tax > 100_000  # Should be substantial
-        assert result.tax_metrics.total_taxes > 0
-        
-        # Verify profit is reduced by taxes
-        property_profit_before_tax = result.early_repayment_metrics.net_gain_property
-        assert result.tax_metrics.net_profit_after_taxes < property_profit_before_tax
-    
     def test_specific_scenario(self):
         """Test specific scenario matching user requirements."""
         # 2M house, 1M mortgage, 10 years
@@ -588,7 +600,7 @@ class TestFullCalculation:
         
         # Verify monthly rent calculation
         expected_rent = 2_000_000 * 0.025 / 12  # ~4,167
-        assert abs(result.cash_flow_metrics.monthly_rent - expected_rent) < 1
+        assert result.cash_flow_metrics.monthly_rent == pytest.approx(expected_rent, abs=1)
         
         # Verify cash flow is negative (low rent vs mortgage payment)
         assert result.cash_flow_metrics.monthly_net_cash_flow < 0
@@ -626,4 +638,218 @@ class TestFullCalculation:
         
         # No portfolio investment (all cash in property)
         assert result.portfolio_metrics.cash_in_portfolio == 0
+    
+    def test_equal_inputs_give_equal_independent_results(self, make_inputs):
+        """Test equal scenarios give equal results that do not share state."""
+        inputs = make_inputs(mortgage_term_years=20)
+        equal_inputs = replace(inputs)
+        assert equal_inputs is not inputs
+        
+        first = ScenarioCalculator(inputs).calculate()
+        second = ScenarioCalculator(equal_inputs).calculate()
+        
+        assert second == first
+        assert second is not first
+        assert second.inputs is equal_inputs
+    
+    def test_subclass_stage_override_is_used(self, make_inputs):
+        """Test calculate() runs the stages of the calculator it is called on."""
+        class NoTaxCalculator(ScenarioCalculator):
+            def calculate_taxes(self, appreciation_metrics, early_repayment_metrics):
+                return replace(
+                    super().calculate_taxes(appreciation_metrics, early_repayment_metrics),
+                    capital_gains_tax=0.0,
+                )
+        
+        inputs = make_inputs(mortgage_term_years=20)
+        
+        assert ScenarioCalculator(inputs).calculate().tax_metrics.capital_gains_tax > 0
+        assert NoTaxCalculator(inputs).calculate().tax_metrics.capital_gains_tax == 0.0
+
 
+
+class TestBatchCalculation:
+    """Tests for vectorized batch calculation."""
+    
+    SCENARIOS = [
+        # Mortgaged, sold at end of term
+        dict(property_price=2_000_000, down_payment=1_000_000, available_cash=2_000_000,
+             monthly_income=50_000, monthly_available=10_000,
+             mortgage_term_years=10, years_until_sale=10),
+        # Early sale with urban renewal
+        dict(property_price=2_000_000, down_payment=1_000_000, available_cash=2_000_000,
+             monthly_income=36_000, monthly_available=10_000,
+             mortgage_term_years=20, years_until_sale=10, urban_renewal_value=500_000),
+        # Full cash purchase
+        dict(property_price=2_000_000, down_payment=2_000_000, available_cash=2_000_000,
+             monthly_income=30_000, monthly_available=10_000,
+             mortgage_term_years=10, years_until_sale=10),
+        # Additional property with improvements and high leverage
+        dict(property_price=5_000_000, down_payment=1_000_000, available_cash=1_500_000,
+             monthly_income=100_000, monthly_available=30_000,
+             mortgage_term_years=25, years_until_sale=15,
+             is_first_house=False, improvement_costs=200_000),
+    ]
+    
+    @staticmethod
+    def _columns(scenarios):
+        """Stack scenario dicts into per-field arrays."""
+        defaults = dict(urban_renewal_value=0.0, is_first_house=True, improvement_costs=0.0)
+        rows = [{**defaults, **scenario} for scenario in scenarios]
+        return {key: np.array([row[key] for row in rows]) for key in rows[0]}
+    
+    @pytest.mark.parametrize(
+        "assumptions",
+        [
+            InvestmentAssumptions(),
+            # Exercises the zero-rate branches of the closed-form annuities
+            InvestmentAssumptions(
+                mortgage_rate=0.0, early_repayment_rate=0.0, portfolio_return_rate=0.0
+            ),
+        ],
+        ids=["default-rates", "zero-rates"],
+    )
+    def test_batch_matches_scalar_calculation(self, assumptions):
+        """Each batch element should match calculate() on the same scenario."""
+        batch = ScenarioCalculator.calculate_batch(
+            **self._columns(self.SCENARIOS), assumptions=assumptions
+        )
+        
+        assert len(batch) == len(self.SCENARIOS)
+        for i, scenario in enumerate(self.SCENARIOS):
+            result = ScenarioCalculator(ScenarioInputs(**scenario), assumptions).calculate()
+            for group in (
+                "loan_metrics", "cash_flow_metrics", "appreciation_metrics",
+                "early_repayment_metrics", "portfolio_metrics", "tax_metrics",
+            ):
+                expected = getattr(result, group)
+                actual = getattr(batch, group)
+                for name in (f.name for f in fields(expected)):
+                    assert getattr(actual, name)[i] == pytest.approx(
+                        getattr(expected, name), rel=1e-6, abs=1e-6
+                    ), f"{group}.{name}"
+            assert batch.total_value_at_sale[i] == pytest.approx(result.total_value_at_sale, rel=1e-9)
+            assert batch.total_profit[i] == pytest.approx(result.total_profit, rel=1e-9)
+            assert batch.annual_return[i] == pytest.approx(result.annual_return, rel=1e-9)
+            assert bool(batch.is_valid[i]) == result.is_valid
+    
+    def test_negative_value_at_sale_gives_nan_return(self):
+        """A negative value at sale has no real annual return in either path."""
+        inputs = ScenarioInputs(
+            property_price=2_000_000,
+            down_payment=0,
+            available_cash=4_850_000,
+            monthly_income=30_000,
+            monthly_available=10_000,
+            mortgage_term_years=2,
+            years_until_sale=25,
+        )
+        assumptions = InvestmentAssumptions(
+            mortgage_rate=0.0, portfolio_return_rate=0.0, appreciation_rate=-0.0056
+        )
+        
+        result = ScenarioCalculator(inputs, assumptions).calculate()
+        batch = ScenarioCalculator.calculate_records(
+            ScenarioInputs.to_records([inputs]), assumptions
+        )
+        
+        assert result.total_value_at_sale < 0
+        assert batch.total_value_at_sale[0] == pytest.approx(result.total_value_at_sale)
+        assert isinstance(result.annual_return, float)
+        assert np.isnan(result.annual_return)
+        assert np.isnan(batch.annual_return[0])
+    
+    def test_batch_broadcasts_scalars(self):
+        """Scalar inputs should broadcast against array inputs."""
+        down_payments = np.array([500_000, 1_000_000, 1_500_000])
+        batch = ScenarioCalculator.calculate_batch(
+            property_price=2_000_000,
+            down_payment=down_payments,
+            available_cash=2_000_000,
+            monthly_income=50_000,
+            monthly_available=10_000,
+            mortgage_term_years=20,
+            years_until_sale=15,
+        )
+        
+        assert len(batch) == 3
+        np.testing.assert_allclose(batch.loan_metrics.loan_amount, 2_000_000 - down_payments)
+    
+    def test_batch_validates_inputs(self):
+        """Invalid values anywhere in the batch should raise ValueError."""
+        with pytest.raises(ValueError, match="property_price must be positive"):
+            ScenarioCalculator.calculate_batch(
+                property_price=np.array([2_000_000, -1]),
+                down_payment=500_000,
+                available_cash=2_000_000,
+                monthly_income=50_000,
+                monthly_available=10_000,
+                mortgage_term_years=20,
+                years_until_sale=15,
+            )
+    
+    def test_batch_to_records_flattens_columns(self):
+        """Test batch results flatten into a structured array per scenario."""
+        batch = ScenarioCalculator.calculate_batch(**self._columns(self.SCENARIOS))
+        
+        records = batch.to_records()
+        
+        assert len(records) == len(self.SCENARIOS)
+        np.testing.assert_array_equal(records["total_profit"], batch.total_profit)
+        np.testing.assert_array_equal(
+            records["monthly_payment"], batch.loan_metrics.monthly_payment
+        )
+        assert records["is_valid"].dtype == bool
+    
+    def test_records_match_column_batch(self):
+        """Test a structured array of scenarios gives the same batch results."""
+        columns = self._columns(self.SCENARIOS)
+        records = np.rec.fromarrays(list(columns.values()), names=list(columns))
+        
+        expected = ScenarioCalculator.calculate_batch(**columns)
+        batch = ScenarioCalculator.calculate_records(records)
+        
+        np.testing.assert_allclose(batch.total_profit, expected.total_profit)
+        np.testing.assert_array_equal(batch.is_valid, expected.is_valid)
+    
+    def test_stacked_inputs_match_scalar_calculation(self):
+        """Test stacking ScenarioInputs into records matches per-scenario results."""
+        inputs = [ScenarioInputs(**scenario) for scenario in self.SCENARIOS]
+        
+        batch = ScenarioCalculator.calculate_records(ScenarioInputs.to_records(inputs))
+        
+        for i, scenario_inputs in enumerate(inputs):
+            expected = ScenarioCalculator(scenario_inputs).calculate()
+            assert batch.total_profit[i] == pytest.approx(expected.total_profit)
+            assert bool(batch.is_valid[i]) is expected.is_valid
+    
+    def test_records_reject_unknown_columns(self):
+        """Test unknown structured-array columns raise ValueError."""
+        records = np.zeros(2, dtype=[("property_price", float), ("price_typo", float)])
+        
+        with pytest.raises(ValueError, match="price_typo"):
+            ScenarioCalculator.calculate_records(records)
+    
+    def test_sensitivity_matches_scalar_calculation(self):
+        """Test sweeping one field matches recalculating each point."""
+        inputs = ScenarioInputs(**self.SCENARIOS[0])
+        rates = [0.03, 0.05, 0.07]
+        
+        sweep = ScenarioCalculator(inputs).calculate_sensitivity("mortgage_rate", rates)
+        
+        assert len(sweep) == len(rates)
+        for i, rate in enumerate(rates):
+            expected = ScenarioCalculator(
+                inputs, InvestmentAssumptions(mortgage_rate=rate)
+            ).calculate()
+            assert sweep.total_profit[i] == pytest.approx(expected.total_profit)
+            assert sweep.loan_metrics.monthly_payment[i] == pytest.approx(
+                expected.loan_metrics.monthly_payment
+            )
+    
+    def test_sensitivity_rejects_unknown_field(self):
+        """Test sweeping an unknown field raises ValueError."""
+        calculator = ScenarioCalculator(ScenarioInputs(**self.SCENARIOS[0]))
+        
+        with pytest.raises(ValueError, match="Unknown scenario field"):
+            calculator.calculate_sensitivity("risk_free_rate", [0.01, 0.02])
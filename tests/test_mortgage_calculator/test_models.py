@@ -2,6 +2,8 @@
 
 Run only calculator tests with: pytest -m calculator
 """
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
 
 from mortgage_return_scenario_calculator.models import (
@@ -15,11 +17,21 @@ from mortgage_return_scenario_calculator.models import (
     PortfolioMetrics,
     TaxMetrics,
     ScenarioResult,
+    scenario_inputs_dtype,
 )
 
 
 pytestmark = pytest.mark.calculator
 
+# All-zero stage metrics (frozen, so safe to share between tests)
+_ZERO_LOAN = LoanMetrics(0, 0, 1, 1, 0, 0, 0, 0, 0)
+_ZERO_CASH_FLOW = CashFlowMetrics(0, 0, 0, 0, 0, 0, 0)
+_ZERO_APPRECIATION = AppreciationMetrics(0, 0, 0, 0, 0, 0, 0, 0)
+_ZERO_EARLY_REPAYMENT = EarlyRepaymentMetrics(0, 0, 0, 0, 0)
+_ZERO_PORTFOLIO = PortfolioMetrics(0, 0, 0, 0, 0, 0, 0)
+_ZERO_TAX = TaxMetrics(0, 0, 0, 0, 0, 0)
+_DEFAULT_ASSUMPTIONS = InvestmentAssumptions()
+
 
 class TestInvestmentAssumptions:
     """Tests for InvestmentAssumptions dataclass."""
@@ -55,17 +67,9 @@ class TestInvestmentAssumptions:
 class TestScenarioInputs:
     """Tests for ScenarioInputs dataclass."""
     
-    def test_basic_creation(self):
+    def test_basic_creation(self, base_inputs_kwargs):
         """Test basic scenario inputs creation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = ScenarioInputs(**base_inputs_kwargs)
         
         assert inputs.property_price == 2_000_000
         assert inputs.down_payment == 1_000_000
@@ -75,103 +79,67 @@ class TestScenarioInputs:
         assert inputs.is_first_house is True  # Default should be True
         assert inputs.improvement_costs == 0.0  # Default should be 0.0
     
-    def test_urban_renewal_cap(self):
+    def test_urban_renewal_cap(self, base_inputs_kwargs):
         """Test urban renewal value is capped at 400,000."""
         inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
+            **base_inputs_kwargs,
             urban_renewal_value=500_000,  # Should be capped
         )
         
         assert inputs.urban_renewal_value == 400_000
     
-    def test_calculate_monthly_rent(self):
+    def test_inputs_are_frozen_and_hashable(self, base_inputs_kwargs):
+        """Test inputs are immutable, so they can be shared and used as dict keys."""
+        inputs = ScenarioInputs(**base_inputs_kwargs)
+        
+        assert hash(inputs) == hash(replace(inputs))
+        with pytest.raises(FrozenInstanceError):
+            inputs.property_price = 1_000_000
+    
+    def test_to_records_stacks_scenarios(self, base_inputs_kwargs):
+        """Test many inputs stack into one structured array."""
+        base = ScenarioInputs(**base_inputs_kwargs)
+        other = replace(base, down_payment=1_500_000, is_first_house=False)
+        
+        records = ScenarioInputs.to_records([base, other])
+        
+        assert records.dtype == scenario_inputs_dtype()
+        assert list(records["down_payment"]) == [1_000_000, 1_500_000]
+        assert list(records["is_first_house"]) == [True, False]
+        assert base.to_record() == records[0]
+    
+    def test_calculate_monthly_rent(self, base_inputs_kwargs):
         """Test monthly rent calculation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = ScenarioInputs(**base_inputs_kwargs)
         
         monthly_rent = inputs.calculate_monthly_rent(0.03)  # 3% yield
         expected = 2_000_000 * 0.03 / 12  # 5,000
-        assert abs(monthly_rent - expected) < 0.01
+        assert monthly_rent == pytest.approx(expected, abs=0.01)
     
-    def test_calculate_mortgage_amount(self):
+    def test_calculate_mortgage_amount(self, base_inputs_kwargs):
         """Test mortgage amount calculation."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=500_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
+        inputs = ScenarioInputs(**{**base_inputs_kwargs, "down_payment": 500_000})
         
         mortgage = inputs.calculate_mortgage_amount()
         assert mortgage == 1_500_000
     
-    def test_validation_negative_property_price(self):
-        """Test validation rejects negative property price."""
-        with pytest.raises(ValueError, match="property_price must be positive"):
-            ScenarioInputs(
-                property_price=-100,
-                down_payment=1_000_000,
-                available_cash=2_000_000,
-                monthly_income=30_000,
-                monthly_available=10_000,
-                mortgage_term_years=10,
-                years_until_sale=10,
-            )
-    
-    def test_validation_zero_property_price(self):
-        """Test validation rejects zero property price."""
-        with pytest.raises(ValueError, match="property_price must be positive"):
-            ScenarioInputs(
-                property_price=0,
-                down_payment=1_000_000,
-                available_cash=2_000_000,
-                monthly_income=30_000,
-                monthly_available=10_000,
-                mortgage_term_years=10,
-                years_until_sale=10,
-            )
-    
-    def test_validation_negative_down_payment(self):
-        """Test validation rejects negative down payment."""
-        with pytest.raises(ValueError, match="down_payment cannot be negative"):
-            ScenarioInputs(
-                property_price=2_000_000,
-                down_payment=-100,
-                available_cash=2_000_000,
-                monthly_income=30_000,
-                monthly_available=10_000,
-                mortgage_term_years=10,
-                years_until_sale=10,
-            )
-    
-    def test_validation_zero_mortgage_term(self):
-        """Test validation rejects zero mortgage term."""
-        with pytest.raises(ValueError, match="mortgage_term_years must be positive"):
-            ScenarioInputs(
-                property_price=2_000_000,
-                down_payment=1_000_000,
-                available_cash=2_000_000,
-                monthly_income=30_000,
-                monthly_available=10_000,
-                mortgage_term_years=0,
-                years_until_sale=10,
-            )
+    @pytest.mark.parametrize(
+        "field_name, bad_value, message",
+        [
+            ("property_price", -100, "property_price must be positive"),
+            ("property_price", 0, "property_price must be positive"),
+            ("down_payment", -100, "down_payment cannot be negative"),
+            ("mortgage_term_years", 0, "mortgage_term_years must be positive"),
+            ("improvement_costs", -100_000, "improvement_costs cannot be negative"),
+        ],
+    )
+    def test_validation(self, make_inputs, field_name, bad_value, message):
+        """Test validation rejects an invalid value for each checked field."""
+        valid_inputs = make_inputs()
+        
+        # replace() re-runs __init__, so __post_init__ validation applies
+        with pytest.raises(ValueError, match=message):
+            replace(valid_inputs, **{field_name: bad_value})
 
 
 class TestInvestmentRestrictions:
@@ -199,135 +167,129 @@ class TestInvestmentRestrictions:
         assert restrictions.require_positive_cash_flow is True
 
 
-class TestLoanMetrics:
-    """Tests for LoanMetrics dataclass."""
+class TestMetricsDataclasses:
+    """Tests for the per-stage metrics dataclasses."""
     
-    def test_creation(self):
-        """Test loan metrics creation."""
-        metrics = LoanMetrics(
-            loan_amount=1_000_000,
-            leverage_ratio=0.5,
-            equity_ratio=0.5,
-            leverage_multiplier=2.0,
-            monthly_payment=10_000,
-            total_payments=1_200_000,
-            total_interest=200_000,
-            avg_monthly_interest=1_667,
-            mortgage_to_income_ratio=0.30,
-        )
+    @pytest.mark.parametrize(
+        "metrics_cls, kwargs",
+        [
+            pytest.param(
+                LoanMetrics,
+                dict(
+                    loan_amount=1_000_000,
+                    leverage_ratio=0.5,
+                    equity_ratio=0.5,
+                    leverage_multiplier=2.0,
+                    monthly_payment=10_000,
+                    total_payments=1_200_000,
+                    total_interest=200_000,
+                    avg_monthly_interest=1_667,
+                    mortgage_to_income_ratio=0.30,
+                ),
+                id="loan",
+            ),
+            pytest.param(
+                CashFlowMetrics,
+                dict(
+                    monthly_rent=5_000,
+                    rental_yield=0.025,
+                    monthly_net_cash_flow=-5_000,
+                    monthly_interest_flow=3_333,
+                    avg_principal_payment=-8_333,
+                    leveraged_rental_yield=0.05,
+                    net_leveraged_yield=0.002,
+                ),
+                id="cash-flow",
+            ),
+            pytest.param(
+                AppreciationMetrics,
+                dict(
+                    property_appreciation=800_000,
+                    urban_renewal_appreciation=160_000,
+                    total_appreciation=1_360_000,
+                    sale_value=3_360_000,
+                    total_return_rate=0.68,
+                    annualized_return=0.04,
+                    leveraged_return=0.08,
+                    net_annual_return=0.10,
+                ),
+                id="appreciation",
+            ),
+            pytest.param(
+                EarlyRepaymentMetrics,
+                dict(
+                    remaining_mortgage=500_000,
+                    early_repayment_penalty=10_000,
+                    total_debt_to_bank=510_000,
+                    proceeds_minus_debt=2_850_000,
+                    net_gain_property=1_850_000,
+                ),
+                id="early-repayment",
+            ),
+            pytest.param(
+                PortfolioMetrics,
+                dict(
+                    cash_in_portfolio=1_000_000,
+                    portfolio_initial_growth=1_967_151,
+                    monthly_deposits=3_658,
+                    accumulated_deposits=633_076,
+                    total_portfolio_value=2_600_227,
+                    portfolio_after_tax=2_309_898,
+                    net_portfolio_profit=870_986,
+                ),
+                id="portfolio",
+            ),
+            pytest.param(
+                TaxMetrics,
+                dict(
+                    purchase_tax=100_000,
+                    purchase_tax_rate=0.05,
+                    capital_gains=500_000,
+                    capital_gains_tax=125_000,
+                    total_taxes=225_000,
+                    net_profit_after_taxes=275_000,
+                ),
+                id="tax",
+            ),
+        ],
+    )
+    def test_creation(self, metrics_cls, kwargs):
+        """Test metrics keep every value they were created with."""
+        metrics = metrics_cls(**kwargs)
         
-        assert metrics.loan_amount == 1_000_000
-        assert metrics.leverage_ratio == 0.5
-        assert metrics.monthly_payment == 10_000
-        assert metrics.mortgage_to_income_ratio == 0.30
-
-
-class TestCashFlowMetrics:
-    """Tests for CashFlowMetrics dataclass."""
-    
-    def test_creation(self):
-        """Test cash flow metrics creation."""
-        metrics = CashFlowMetrics(
-            monthly_rent=5_000,
-            rental_yield=0.025,
-            monthly_net_cash_flow=-5_000,
-            monthly_interest_flow=3_333,
-            avg_principal_payment=-8_333,
-            leveraged_rental_yield=0.05,
-            net_leveraged_yield=0.002,
-        )
-        
-        assert metrics.monthly_rent == 5_000
-        assert metrics.monthly_net_cash_flow == -5_000
-
-
-class TestAppreciationMetrics:
-    """Tests for AppreciationMetrics dataclass."""
+        assert {name: getattr(metrics, name) for name in kwargs} == kwargs
     
-    def test_creation(self):
-        """Test appreciation metrics creation."""
-        metrics = AppreciationMetrics(
-            property_appreciation=800_000,
-            urban_renewal_appreciation=160_000,
-            total_appreciation=1_360_000,
-            sale_value=3_360_000,
-            total_return_rate=0.68,
-            annualized_return=0.04,
-            leveraged_return=0.08,
-            net_annual_return=0.10,
-        )
-        
-        assert metrics.property_appreciation == 800_000
-        assert metrics.total_return_rate == 0.68
-
-
-class TestEarlyRepaymentMetrics:
-    """Tests for EarlyRepaymentMetrics dataclass."""
-    
-    def test_creation(self):
-        """Test early repayment metrics creation."""
-        metrics = EarlyRepaymentMetrics(
-            remaining_mortgage=500_000,
-            early_repayment_penalty=10_000,
-            total_debt_to_bank=510_000,
-            proceeds_minus_debt=2_850_000,
-            net_gain_property=1_850_000,
-        )
-        
-        assert metrics.remaining_mortgage == 500_000
-        assert metrics.total_debt_to_bank == 510_000
-
-
-class TestPortfolioMetrics:
-    """Tests for PortfolioMetrics dataclass."""
-    
-    def test_creation(self):
-        """Test portfolio metrics creation."""
-        metrics = PortfolioMetrics(
-            cash_in_portfolio=1_000_000,
-            portfolio_initial_growth=1_967_151,
-            monthly_deposits=3_658,
-            accumulated_deposits=633_076,
-            total_portfolio_value=2_600_227,
-            portfolio_after_tax=2_309_898,
-            net_portfolio_profit=870_986,
+    def test_uses_slots(self):
+        """Test metrics are slotted so no per-instance __dict__ is allocated."""
+        metrics = LoanMetrics(
+            loan_amount=0,
+            leverage_ratio=0,
+            equity_ratio=1.0,
+            leverage_multiplier=1.0,
+            monthly_payment=0,
+            total_payments=0,
+            total_interest=0,
+            avg_monthly_interest=0,
+            mortgage_to_income_ratio=0,
         )
         
-        assert metrics.cash_in_portfolio == 1_000_000
-        assert metrics.total_portfolio_value == 2_600_227
+        assert not hasattr(metrics, "__dict__")
 
 
 class TestScenarioResult:
     """Tests for ScenarioResult dataclass."""
     
-    def test_default_validation(self):
+    def test_default_validation(self, make_inputs):
         """Test default validation state."""
-        # Create minimal mocks
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-        )
-        assumptions = InvestmentAssumptions()
-        loan = LoanMetrics(0, 0, 1, 1, 0, 0, 0, 0, 0)
-        cash_flow = CashFlowMetrics(0, 0, 0, 0, 0, 0, 0)
-        appreciation = AppreciationMetrics(0, 0, 0, 0, 0, 0, 0, 0)
-        early_repay = EarlyRepaymentMetrics(0, 0, 0, 0, 0)
-        portfolio = PortfolioMetrics(0, 0, 0, 0, 0, 0, 0)
-        
         result = ScenarioResult(
-            inputs=inputs,
-            assumptions=assumptions,
-            loan_metrics=loan,
-            cash_flow_metrics=cash_flow,
-            appreciation_metrics=appreciation,
-            early_repayment_metrics=early_repay,
-            portfolio_metrics=portfolio,
-            tax_metrics=TaxMetrics(0, 0, 0, 0, 0, 0),
+            inputs=make_inputs(),
+            assumptions=_DEFAULT_ASSUMPTIONS,
+            loan_metrics=_ZERO_LOAN,
+            cash_flow_metrics=_ZERO_CASH_FLOW,
+            appreciation_metrics=_ZERO_APPRECIATION,
+            early_repayment_metrics=_ZERO_EARLY_REPAYMENT,
+            portfolio_metrics=_ZERO_PORTFOLIO,
+            tax_metrics=_ZERO_TAX,
             total_value_at_sale=0,
             total_profit=0,
             annual_return=0,
@@ -340,24 +302,6 @@ class TestScenarioResult:
 class TestTaxMetrics:
     """Tests for TaxMetrics dataclass."""
     
-    def test_tax_metrics_creation(self):
-        """Test TaxMetrics can be created with valid values."""
-        tax_metrics = TaxMetrics(
-            purchase_tax=100_000,
-            purchase_tax_rate=0.05,
-            capital_gains=500_000,
-            capital_gains_tax=125_000,
-            total_taxes=225_000,
-            net_profit_after_taxes=275_000,
-        )
-        
-        assert tax_metrics.purchase_tax == 100_000
-        assert tax_metrics.purchase_tax_rate == 0.05
-        assert tax_metrics.capital_gains == 500_000
-        assert tax_metrics.capital_gains_tax == 125_000
-        assert tax_metrics.total_taxes == 225_000
-        assert tax_metrics.net_profit_after_taxes == 275_000
-    
     def test_tax_metrics_total_taxes_calculation(self):
         """Test that total_taxes equals purchase_tax + capital_gains_tax."""
         tax_metrics = TaxMetrics(
@@ -375,47 +319,14 @@ class TestTaxMetrics:
 class TestScenarioInputsTaxFields:
     """Tests for tax-related fields in ScenarioInputs."""
     
-    def test_is_first_house_field(self):
+    def test_is_first_house_field(self, base_inputs_kwargs):
         """Test is_first_house field can be set."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            is_first_house=False,
-        )
+        inputs = ScenarioInputs(**{**base_inputs_kwargs, "is_first_house": False})
         
         assert inputs.is_first_house is False
     
-    def test_improvement_costs_field(self):
+    def test_improvement_costs_field(self, base_inputs_kwargs):
         """Test improvement_costs field can be set."""
-        inputs = ScenarioInputs(
-            property_price=2_000_000,
-            down_payment=1_000_000,
-            available_cash=2_000_000,
-            monthly_income=30_000,
-            monthly_available=10_000,
-            mortgage_term_years=10,
-            years_until_sale=10,
-            improvement_costs=200_000,
-        )
+        inputs = ScenarioInputs(**{**base_inputs_kwargs, "improvement_costs": 200_000})
         
         assert inputs.improvement_costs == 200_000
-    
-    def test_improvement_costs_validation(self):
-        """Test improvement_costs cannot be negative."""
-        with pytest.raises(ValueError, match="improvement_costs cannot be negative"):
-            ScenarioInputs(
-                property_price=2_000_000,
-                down_payment=1_000_000,
-                available_cash=2_000_000,
-                monthly_income=30_000,
-                monthly_available=10_000,
-                mortgage_term_years=10,
-                years_until_sale=10,
-                improvement_costs=-100_000,
-            )
-
@@ -59,210 +59,194 @@ SAMPLE_LISTING_JSON = {
     },
 }
 
+# API response wrapping the sample listing and a second, differently priced one
+SAMPLE_API_RESPONSE_TWO_LISTINGS = {
+    "data": [[
+        SAMPLE_LISTING_JSON,
+        {**SAMPLE_LISTING_JSON, "token": "xyz789", "price": 2000000}
+    ]]
+}
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """A single ListingParser shared by the module (it holds no per-listing state)."""
+    return ListingParser()
+
+
+@pytest.fixture(scope="module")
+def timed_parse(parser):
+    """Parse SAMPLE_LISTING_JSON once, bracketed by wall-clock readings.
+
+    Returns:
+        Tuple of (before, listing, after); the parser stamps scraped_at with
+        local datetime.now(), so the bounds use the same clock.
+    """
+    before = datetime.now()
+    listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
+    after = datetime.now()
+    return before, listing, after
+
+
+@pytest.fixture(scope="module")
+def parsed_listing(timed_parse):
+    """SAMPLE_LISTING_JSON parsed once and shared by the read-only field tests."""
+    return timed_parse[1]
+
+
+@pytest.fixture
+def listing_template():
+    """Fresh top-level copy of SAMPLE_LISTING_JSON for tests that replace a key."""
+    return dict(SAMPLE_LISTING_JSON)
+
 
 class TestParserInitialization:
     """Test parser initialization."""
 
-    def test_parser_creates_instance(self):
+    def test_parser_creates_instance(self, parser):
         """Parser should be instantiable."""
-        parser = ListingParser()
-        assert parser is not None
+        assert isinstance(parser, ListingParser)
 
 
 class TestParserSingleListing:
     """Test parsing a single listing from JSON."""
 
-    def test_parse_listing_returns_listing_object(self):
+    def test_parse_listing_returns_listing_object(self, parsed_listing):
         """parse_listing should return a Listing dataclass."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert isinstance(listing, Listing)
+        assert isinstance(parsed_listing, Listing)
 
-    def test_parse_listing_extracts_city(self):
+    def test_parse_listing_extracts_city(self, parsed_listing):
         """Parser should extract city name."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.city == "באר שבע"
+        assert parsed_listing.city == "באר שבע"
 
-    def test_parse_listing_extracts_price(self):
+    def test_parse_listing_extracts_price(self, parsed_listing):
         """Parser should extract price."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.price == 1820000
+        assert parsed_listing.price == 1820000
 
-    def test_parse_listing_extracts_rooms(self):
+    def test_parse_listing_extracts_rooms(self, parsed_listing):
         """Parser should extract room count."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.rooms == 4
+        assert parsed_listing.rooms == 4
 
-    def test_parse_listing_extracts_sqm(self):
+    def test_parse_listing_extracts_sqm(self, parsed_listing):
         """Parser should extract square meters."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.sqm == 150
+        assert parsed_listing.sqm == 150
 
-    def test_parse_listing_extracts_floor(self):
+    def test_parse_listing_extracts_floor(self, parsed_listing):
         """Parser should extract floor number."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.floor == 2
+        assert parsed_listing.floor == 2
 
-    def test_parse_listing_extracts_neighborhood(self):
+    def test_parse_listing_extracts_neighborhood(self, parsed_listing):
         """Parser should extract neighborhood name."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.neighborhood == "שכונה ג'"
+        assert parsed_listing.neighborhood == "שכונה ג'"
 
-    def test_parse_listing_extracts_asset_type(self):
+    def test_parse_listing_extracts_asset_type(self, parsed_listing):
         """Parser should extract asset type."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.asset_type == "דירה"
+        assert parsed_listing.asset_type == "דירה"
 
-    def test_parse_listing_extracts_description(self):
+    def test_parse_listing_extracts_description(self, parsed_listing):
         """Parser should extract description."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert "משודרגת" in listing.description
+        assert "משודרגת" in parsed_listing.description
 
-    def test_parse_listing_extracts_url(self):
+    def test_parse_listing_extracts_url(self, parsed_listing):
         """Parser should generate URL from token."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert "7a7i4007" in listing.url
+        assert "7a7i4007" in parsed_listing.url
 
-    def test_parse_listing_has_scraped_at(self):
-        """Parser should set scraped_at timestamp."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert isinstance(listing.scraped_at, datetime)
+    def test_parse_listing_has_scraped_at(self, timed_parse):
+        """Parser should stamp scraped_at with the time of parsing."""
+        before, listing, after = timed_parse
+        assert before <= listing.scraped_at <= after
 
 
 class TestParserPropertyFeatures:
     """Test parsing property feature fields."""
 
-    def test_parse_listing_extracts_parking(self):
+    def test_parse_listing_extracts_parking(self, parsed_listing):
         """Parser should extract parking count."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.parking == 1
+        assert parsed_listing.parking == 1
 
-    def test_parse_listing_extracts_balconies(self):
+    def test_parse_listing_extracts_balconies(self, parsed_listing):
         """Parser should extract balcony count."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.balconies == 1
+        assert parsed_listing.balconies == 1
 
-    def test_parse_listing_extracts_elevator(self):
+    def test_parse_listing_extracts_elevator(self, parsed_listing):
         """Parser should extract elevator presence."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.elevator is True
+        assert parsed_listing.elevator is True
 
-    def test_parse_listing_extracts_mamad(self):
+    def test_parse_listing_extracts_mamad(self, parsed_listing):
         """Parser should extract mamad (security room) presence."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.mamad is False
+        assert parsed_listing.mamad is False
 
-    def test_parse_listing_extracts_storage_unit(self):
+    def test_parse_listing_extracts_storage_unit(self, parsed_listing):
         """Parser should extract storage unit presence."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.storage_unit is True
+        assert parsed_listing.storage_unit is True
 
-    def test_parse_listing_extracts_total_floors(self):
+    def test_parse_listing_extracts_total_floors(self, parsed_listing):
         """Parser should extract total floors in building."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.total_floors == 16
+        assert parsed_listing.total_floors == 16
 
-    def test_parse_listing_extracts_condition(self):
+    def test_parse_listing_extracts_condition(self, parsed_listing):
         """Parser should extract property condition."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.condition == "חדש (גרו בנכס)"
+        assert parsed_listing.condition == "חדש (גרו בנכס)"
 
-    def test_parse_listing_extracts_entrance_date(self):
+    def test_parse_listing_extracts_entrance_date(self, parsed_listing):
         """Parser should extract entrance date."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert listing.entrance_date == "2025-06-16"
+        assert parsed_listing.entrance_date == "2025-06-16"
 
 
 class TestParserAddress:
     """Test parsing address fields."""
 
-    def test_parse_listing_extracts_street_address(self):
+    def test_parse_listing_extracts_street_address(self, parsed_listing):
         """Parser should extract street address."""
-        parser = ListingParser()
-        listing = parser.parse_listing(SAMPLE_LISTING_JSON, city="באר שבע")
-        assert "גולומב" in listing.address
-        assert "17" in listing.address
+        assert "גולומב" in parsed_listing.address
+        assert "17" in parsed_listing.address
 
 
 class TestParserMissingFields:
     """Test handling of missing or null fields."""
 
-    def test_parse_listing_handles_missing_price(self):
+    def test_parse_listing_handles_missing_price(self, parser, listing_template):
         """Parser should handle missing price."""
-        data = {**SAMPLE_LISTING_JSON, "price": 0}
-        parser = ListingParser()
-        listing = parser.parse_listing(data, city="באר שבע")
+        listing_template["price"] = 0
+        listing = parser.parse_listing(listing_template, city="באר שבע")
         assert listing.price is None  # 0 means no price
 
-    def test_parse_listing_handles_missing_rooms(self):
+    def test_parse_listing_handles_missing_rooms(self, parser, listing_template):
         """Parser should handle missing room count."""
-        data = {**SAMPLE_LISTING_JSON}
-        data["additionalDetails"] = {}
-        parser = ListingParser()
-        listing = parser.parse_listing(data, city="באר שבע")
+        listing_template["additionalDetails"] = {}
+        listing = parser.parse_listing(listing_template, city="באר שבע")
         assert listing.rooms is None
 
-    def test_parse_listing_handles_missing_address(self):
+    def test_parse_listing_handles_missing_address(self, parser, listing_template):
         """Parser should handle missing address."""
-        data = {**SAMPLE_LISTING_JSON}
-        data["address"] = {}
-        parser = ListingParser()
-        listing = parser.parse_listing(data, city="באר שבע")
+        listing_template["address"] = {}
+        listing = parser.parse_listing(listing_template, city="באר שבע")
         assert listing.address is None or listing.address == ""
 
-    def test_parse_listing_handles_missing_elevator(self):
+    def test_parse_listing_handles_missing_elevator(self, parser, listing_template):
         """Parser should handle missing elevator info."""
-        data = {**SAMPLE_LISTING_JSON}
-        data["inProperty"] = {}
-        parser = ListingParser()
-        listing = parser.parse_listing(data, city="באר שבע")
+        listing_template["inProperty"] = {}
+        listing = parser.parse_listing(listing_template, city="באר שבע")
         assert listing.elevator is None
 
 
 class TestParserApiResponse:
     """Test parsing full API response."""
 
-    def test_parse_response_extracts_all_listings(self):
+    def test_parse_response_extracts_all_listings(self, parser):
         """parse_response should extract all listings from API response."""
-        api_response = {
-            "data": [[
-                SAMPLE_LISTING_JSON,
-                {**SAMPLE_LISTING_JSON, "token": "xyz789", "price": 2000000}
-            ]]
-        }
-        parser = ListingParser()
-        listings = parser.parse_response(api_response, city="באר שבע")
+        listings = parser.parse_response(SAMPLE_API_RESPONSE_TWO_LISTINGS, city="באר שבע")
         assert len(listings) == 2
 
-    def test_parse_response_handles_empty_data(self):
+    def test_parse_response_handles_empty_data(self, parser):
         """parse_response should handle empty data array."""
         api_response = {"data": [[]]}
-        parser = ListingParser()
         listings = parser.parse_response(api_response, city="באר שבע")
         assert listings == []
 
-    def test_parse_response_handles_missing_data_key(self):
+    def test_parse_response_handles_missing_data_key(self, parser):
         """parse_response should handle missing data key."""
         api_response = {}
-        parser = ListingParser()
         listings = parser.parse_response(api_response, city="באר שבע")
         assert listings == []
 
@@ -7,11 +7,12 @@ Tests the main orchestration logic for scraping Yad2 listings.
 Run only scraper tests with: pytest -m scraper
 """
 
+import copy
 import pytest
-import responses
-from pathlib import Path
+from dataclasses import replace
+from functools import lru_cache
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, call, patch
 
 from scraper.scraper import Yad2Scraper
 from scraper.config import ScraperConfig
@@ -26,7 +27,17 @@ pytestmark = pytest.mark.scraper
 
 # Sample API response for testing
 def make_api_response(num_listings: int) -> dict:
-    """Create a mock API response with specified number of listings."""
+    """Create a mock API response with specified number of listings.
+    
+    Each call returns a fresh copy of a payload built once per size, so a
+    test that mutates its response cannot leak into other tests.
+    """
+    return copy.deepcopy(_api_response_template(num_listings))
+
+
+@lru_cache(maxsize=None)
+def _api_response_template(num_listings: int) -> dict:
+    """Build the API response for make_api_response; never hand this out directly."""
     listings = []
     for i in range(num_listings):
         listings.append({
@@ -47,35 +58,146 @@ def make_api_response(num_listings: int) -> dict:
     return {"data": [listings]}
 
 
+# Property types pinned on Yad2ApiClient for every test in this module
+PROPERTY_TYPES = [1, 2, 4, 5, 6, 7]
+
+# Listing counts for property types 4, 5, 6 and 7 when only the first two return data
+EMPTY_REMAINING_TYPES = (0, 0, 0, 0)
+
+
+def make_api_responses(*sizes: int) -> list:
+    """Create one fresh API response per listing count, in order."""
+    return [make_api_response(size) for size in sizes]
+
+
+class _StubParser:
+    """ListingParser stand-in that skips field extraction.
+    
+    Each raw listing becomes a minimal Listing whose URL keeps the token, so
+    the scraper's URL-based deduplication behaves as with the real parser.
+    """
+
+    SCRAPED_AT = datetime(2024, 1, 1)
+
+    def parse_response(self, response: dict, city: str) -> list:
+        return [
+            Listing(city=city, url=f"stub/{item['token']}", scraped_at=self.SCRAPED_AT)
+            for item in response.get("data", [[]])[0]
+        ]
+
+
+class _RecordingExporter:
+    """ParquetExporter stand-in that records export calls instead of writing."""
+
+    def __init__(self):
+        self.calls = []
+
+    def export(self, listings, output_path, **kwargs):
+        self.calls.append((listings, output_path))
+
+
+# (listing count returned for each of the 6 property types, expected unique listings)
+SCRAPE_CITY_CASES = [
+    # All mock listings share tokens, so 6 × 10 deduplicate to 10
+    pytest.param((10,) * 6, 10, id="same-listings-every-type"),
+    # Type 2 repeats token_0 and token_1 from type 1
+    pytest.param((3, 2, *EMPTY_REMAINING_TYPES), 3, id="overlapping-types"),
+    pytest.param((0,) * 6, 0, id="empty"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make time.sleep a no-op so rate-limit delays never slow the suite."""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _pin_property_types():
+    """Pin the six property types that the call-count assertions assume."""
+    with patch.object(Yad2ApiClient, "PROPERTY_TYPES", PROPERTY_TYPES):
+        yield
+
+
+@pytest.fixture
+def sleep_calls(monkeypatch):
+    """Record the delays passed to time.sleep instead of sleeping."""
+    calls = []
+    monkeypatch.setattr("time.sleep", calls.append)
+    return calls
+
+
+@pytest.fixture
+def base_config():
+    """Single-city config; tests needing other settings use dataclasses.replace."""
+    return ScraperConfig(cities=["באר שבע"], results_per_page=40)
+
+
+# Spec'd mocks are built fresh per test: copy.copy of a template would share
+# child mocks such as fetch_listings, leaking return values between tests.
+@pytest.fixture
+def api_client():
+    """API client mock restricted to the Yad2ApiClient interface."""
+    return Mock(spec=Yad2ApiClient)
+
+
+@pytest.fixture
+def mock_parser():
+    """Parser mock restricted to the ListingParser interface."""
+    return Mock(spec=ListingParser)
+
+
+@pytest.fixture
+def stub_parser():
+    """Lightweight parser for tests that only count or route listings."""
+    return _StubParser()
+
+
+@pytest.fixture
+def exporter():
+    """Exporter that records (listings, output_path) for each export call."""
+    return _RecordingExporter()
+
+
+@pytest.fixture(scope="module")
+def created_scraper():
+    """Scraper built once by Yad2Scraper.create, plus the patched init_session.
+    
+    create() warms up the API session by visiting yad2.co.il; that call is
+    patched out so the factory test stays offline.
+    """
+    config = ScraperConfig(cities=["באר שבע"], results_per_page=40)
+    with patch.object(Yad2ApiClient, "init_session") as init_session:
+        scraper = Yad2Scraper.create(config)
+    yield scraper, init_session
+    scraper.api_client.close()
+
+
 class TestScraperInitialization:
     """Test Scraper initialization and setup."""
 
-    def test_scraper_accepts_config_and_components(self):
+    def test_scraper_accepts_config_and_components(
+        self, base_config, api_client, mock_parser, exporter
+    ):
         """Scraper should accept config and component dependencies."""
-        config = ScraperConfig(cities=["באר שבע"])
-        api_client = Mock(spec=Yad2ApiClient)
-        parser = Mock(spec=ListingParser)
-        exporter = Mock(spec=ParquetExporter)
-
         scraper = Yad2Scraper(
-            config=config,
+            config=base_config,
             api_client=api_client,
-            parser=parser,
+            parser=mock_parser,
             exporter=exporter,
         )
 
-        assert scraper.config == config
+        assert scraper.config == base_config
         assert scraper.api_client == api_client
-        assert scraper.parser == parser
+        assert scraper.parser == mock_parser
         assert scraper.exporter == exporter
 
-    def test_scraper_create_factory_method(self):
+    def test_scraper_create_factory_method(self, created_scraper, base_config):
         """Factory method should create scraper with all components."""
-        config = ScraperConfig(cities=["באר שבע"])
-        
-        scraper = Yad2Scraper.create(config)
+        scraper, init_session = created_scraper
 
-        assert scraper.config == config
+        assert scraper.config == base_config
+        init_session.assert_called_once_with()
         assert isinstance(scraper.api_client, Yad2ApiClient)
         assert isinstance(scraper.parser, ListingParser)
         assert isinstance(scraper.exporter, ParquetExporter)
@@ -84,184 +206,95 @@ class TestScraperInitialization:
 class TestScrapeSingleCity:
     """Test scraping a single city."""
 
-    def test_scrape_city_fetches_all_property_types(self):
-        """Should fetch all property types for a city."""
-        config = ScraperConfig(cities=["באר שבע"], results_per_page=40)
-        
-        # Mock API client to return listings for each property type
-        api_client = Mock(spec=Yad2ApiClient)
-        api_client.fetch_listings.return_value = make_api_response(10)
+    @pytest.mark.parametrize("sizes_by_type, expected_count", SCRAPE_CITY_CASES)
+    def test_scrape_city(
+        self, base_config, api_client, exporter, sizes_by_type, expected_count
+    ):
+        """Should fetch every property type by city ID and keep unique listings."""
+        api_client.fetch_listings.side_effect = make_api_responses(*sizes_by_type)
         
-        # Mock PROPERTY_TYPES to match real implementation
-        with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-            # Real parser to test integration
-            parser = ListingParser()
-            exporter = Mock(spec=ParquetExporter)
-
-            scraper = Yad2Scraper(
-                config=config,
-                api_client=api_client,
-                parser=parser,
-                exporter=exporter,
-            )
-
-            with patch("time.sleep"):
-                listings = scraper.scrape_city("באר שבע")
-
-        # 6 property types × 10 listings each, but deduplicated by URL
-        # Since all mock listings have same tokens, only 10 unique
-        assert len(listings) == 10
-        assert all(isinstance(l, Listing) for l in listings)
-        # Should call API 6 times (once per property type)
-        assert api_client.fetch_listings.call_count == 6
-
-    def test_scrape_city_deduplicates_listings(self):
-        """Should deduplicate listings by URL across property types."""
-        config = ScraperConfig(cities=["באר שבע"], results_per_page=10)
-        
-        api_client = Mock(spec=Yad2ApiClient)
-        # Different property types return overlapping listings
-        # First type returns 3 listings (token_0, token_1, token_2)
-        # Second type returns 2 listings (token_0, token_1) - duplicates
-        api_client.fetch_listings.side_effect = [
-            make_api_response(3),  # Type 1: 3 listings
-            make_api_response(2),  # Type 2: 2 duplicates
-            make_api_response(0),  # Types 4,5,6,7: empty
-            make_api_response(0),
-            make_api_response(0),
-            make_api_response(0),
-        ]
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
-
-        scraper = Yad2Scraper(
-            config=config,
-            api_client=api_client,
-            parser=parser,
-            exporter=exporter,
-        )
-
-        with patch("time.sleep"):
-            with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-                listings = scraper.scrape_city("באר שבע")
-
-        # Only 3 unique listings (duplicates removed)
-        assert len(listings) == 3
-        assert api_client.fetch_listings.call_count == 6
-
-    def test_scrape_city_empty_results(self):
-        """Should handle city with no listings."""
-        config = ScraperConfig(cities=["באר שבע"], results_per_page=40)
-        
-        api_client = Mock(spec=Yad2ApiClient)
-        api_client.fetch_listings.return_value = {"data": [[]]}
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
-
+        # Real parser to test integration
         scraper = Yad2Scraper(
-            config=config,
+            config=base_config,
             api_client=api_client,
-            parser=parser,
+            parser=ListingParser(),
             exporter=exporter,
         )
 
         listings = scraper.scrape_city("באר שבע")
 
-        assert listings == []
+        assert len(listings) == expected_count
+        assert all(isinstance(l, Listing) for l in listings)
+        # One API call per property type, in order, with Beer Sheva's ID (9000)
+        assert api_client.fetch_listings.call_args_list == [
+            call(9000, property_type) for property_type in PROPERTY_TYPES
+        ]
 
-    def test_scrape_city_uses_city_id(self):
-        """Should convert city name to ID for API call."""
-        config = ScraperConfig(cities=["באר שבע"], results_per_page=40)
-        
-        api_client = Mock(spec=Yad2ApiClient)
-        api_client.fetch_listings.return_value = make_api_response(5)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
+    def test_scrape_city_keeps_first_of_each_url(
+        self, base_config, api_client, stub_parser, exporter
+    ):
+        """Should keep each URL once, in first-seen order, across property types."""
+        api_client.fetch_listings.side_effect = make_api_responses(
+            3, 2, *EMPTY_REMAINING_TYPES
+        )
 
         scraper = Yad2Scraper(
-            config=config,
+            config=base_config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-                scraper.scrape_city("באר שבע")
+        listings = scraper.scrape_city("באר שבע")
 
-        # Beer Sheva ID is 9000, first property type is 1
-        # Check that city_id 9000 was used in all calls
-        calls = api_client.fetch_listings.call_args_list
-        assert all(call[0][0] == 9000 for call in calls)
+        assert [l.url for l in listings] == [
+            "stub/token_0", "stub/token_1", "stub/token_2"
+        ]
 
 
 class TestScrapeMultipleCities:
     """Test scraping multiple cities."""
 
-    def test_scrape_all_cities(self):
+    def test_scrape_all_cities(self, base_config, api_client, stub_parser, exporter):
         """Should scrape all configured cities."""
-        config = ScraperConfig(
-            cities=["באר שבע", "תל אביב"],
-            results_per_page=40,
-        )
+        config = replace(base_config, cities=["באר שבע", "תל אביב"])
         
-        api_client = Mock(spec=Yad2ApiClient)
         # Each property type returns 5 listings
         api_client.fetch_listings.return_value = make_api_response(5)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
             config=config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-                listings = scraper.scrape_all_cities()
+        listings = scraper.scrape_all_cities()
 
         # 5 unique listings per city (deduplicated) × 2 cities = 10
         assert len(listings) == 10
         # API called 6 times per city × 2 cities = 12
         assert api_client.fetch_listings.call_count == 12
 
-    def test_scrape_all_cities_continues_on_error(self):
+    def test_scrape_all_cities_continues_on_error(
+        self, base_config, api_client, stub_parser, exporter
+    ):
         """Should continue scraping if one property type fails."""
-        config = ScraperConfig(
-            cities=["באר שבע"],
-            results_per_page=40,
-        )
-        
-        api_client = Mock(spec=Yad2ApiClient)
         # First property type fails, rest succeed
         api_client.fetch_listings.side_effect = [
             Exception("API Error"),  # Type 1 fails
-            make_api_response(5),    # Type 2 succeeds
-            make_api_response(0),    # Types 4,5,6,7 empty
-            make_api_response(0),
-            make_api_response(0),
-            make_api_response(0),
+            # Type 2 succeeds, the rest are empty
+            *make_api_responses(5, *EMPTY_REMAINING_TYPES),
         ]
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
-            config=config,
+            config=base_config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-                listings = scraper.scrape_all_cities()
+        listings = scraper.scrape_all_cities()
 
         # Should get 5 listings from the successful property type
         assert len(listings) == 5
@@ -272,129 +305,99 @@ class TestScrapeMultipleCities:
 class TestScraperRun:
     """Test the full run workflow."""
 
-    def test_run_exports_to_parquet(self, tmp_path):
+    def test_run_exports_to_parquet(
+        self, tmp_path, base_config, api_client, stub_parser, exporter
+    ):
         """Run should scrape all cities and export to Parquet."""
-        config = ScraperConfig(
-            cities=["באר שבע"],
-            results_per_page=40,
-            output_path=str(tmp_path),
-        )
+        config = replace(base_config, output_path=str(tmp_path))
         
-        api_client = Mock(spec=Yad2ApiClient)
         api_client.fetch_listings.return_value = make_api_response(3)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
             config=config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            result_path = scraper.run()
+        scraper.run()
 
         # Exporter should be called with listings
-        exporter.export.assert_called_once()
-        call_args = exporter.export.call_args
-        exported_listings = call_args[0][0]
+        assert len(exporter.calls) == 1
+        exported_listings, _ = exporter.calls[0]
         assert len(exported_listings) == 3
 
-    def test_run_generates_timestamped_filename(self, tmp_path):
+    def test_run_generates_timestamped_filename(
+        self, tmp_path, base_config, api_client, stub_parser, exporter
+    ):
         """Run should generate a timestamped output filename."""
-        config = ScraperConfig(
-            cities=["באר שבע"],
-            results_per_page=40,
-            output_path=str(tmp_path),
-        )
+        config = replace(base_config, output_path=str(tmp_path))
         
-        api_client = Mock(spec=Yad2ApiClient)
         api_client.fetch_listings.return_value = make_api_response(1)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
             config=config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            result_path = scraper.run()
+        result_path = scraper.run()
 
         # Check the export was called with a path
-        exporter.export.assert_called_once()
-        call_args = exporter.export.call_args
-        output_path = call_args[0][1]
+        assert len(exporter.calls) == 1
+        _, output_path = exporter.calls[0]
         
         # Path should be in the output directory
         assert str(tmp_path) in str(output_path)
         # Should have .parquet extension
         assert str(output_path).endswith(".parquet")
+        # run() returns the path it exported to
+        assert result_path == output_path
 
-    def test_run_with_custom_filename(self, tmp_path):
+    def test_run_with_custom_filename(
+        self, tmp_path, base_config, api_client, stub_parser, exporter
+    ):
         """Run should accept a custom output filename."""
-        config = ScraperConfig(
-            cities=["באר שבע"],
-            results_per_page=40,
-            output_path=str(tmp_path),
-        )
+        config = replace(base_config, output_path=str(tmp_path))
         
-        api_client = Mock(spec=Yad2ApiClient)
         api_client.fetch_listings.return_value = make_api_response(1)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
             config=config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep"):
-            result_path = scraper.run(output_filename="my_export.parquet")
+        result_path = scraper.run(output_filename="my_export.parquet")
 
-        exporter.export.assert_called_once()
-        call_args = exporter.export.call_args
-        output_path = call_args[0][1]
+        assert len(exporter.calls) == 1
+        _, output_path = exporter.calls[0]
         assert "my_export.parquet" in str(output_path)
+        assert result_path == output_path
 
 
 class TestScraperRateLimiting:
     """Test rate limiting behavior."""
 
-    def test_scrape_city_applies_delay_between_property_types(self):
+    def test_scrape_city_applies_delay_between_property_types(
+        self, base_config, api_client, stub_parser, exporter, sleep_calls
+    ):
         """Should add delay between property type fetches."""
-        config = ScraperConfig(
-            cities=["באר שבע"],
-            results_per_page=10,
-            min_delay=1.0,
-            max_delay=2.0,
-        )
+        config = replace(base_config, results_per_page=10, min_delay=1.0, max_delay=2.0)
         
-        api_client = Mock(spec=Yad2ApiClient)
         api_client.fetch_listings.return_value = make_api_response(5)
-        
-        parser = ListingParser()
-        exporter = Mock(spec=ParquetExporter)
 
         scraper = Yad2Scraper(
             config=config,
             api_client=api_client,
-            parser=parser,
+            parser=stub_parser,
             exporter=exporter,
         )
 
-        with patch("time.sleep") as mock_sleep:
-            with patch.object(Yad2ApiClient, 'PROPERTY_TYPES', [1, 2, 4, 5, 6, 7]):
-                scraper.scrape_city("באר שבע")
-            # Should sleep between property types (6 types = 6 sleeps)
-            assert mock_sleep.call_count == 6
+        scraper.scrape_city("באר שבע")
+        # Should sleep between property types (6 types = 6 sleeps)
+        assert len(sleep_calls) == 6
 
 